@@ -607,6 +607,17 @@ def cmd_mods(args):
             print(f"Failed: {len(result['failed'])}")
         return 0
     
+    elif args.popular:
+        # Install the most popular mods from both providers
+        from .mod_manager import ModManager
+        cfg_dict = {'loader': cfg.loader, 'mc_version': cfg.mc_version, 'mods_dir': cfg.mods_dir}
+        mm = ModManager(cfg_dict, cwd=str(CWD))
+        result = mm.install_popular_mods()
+        print(f"\nAdded: {result.get('added', 0)}, downloaded: {result.get('downloaded', 0)}")
+        if result.get('failed'):
+            print(f"Failed: {len(result['failed'])}")
+        return 0 if result.get('status') != "error" else 1
+    
     elif args.sort:
         print("Sorting mods by type...")
         from .mods import sort_mods_by_type
@@ -628,7 +639,7 @@ def cmd_mods(args):
         print(f"Moved {moved} client-only mods to {clientonly_dir}")
     
     else:
-        print("Use --list, --upgrade, or --sort")
+        print("Use --list, --upgrade, --popular, or --sort")
     
     return 0
 
@@ -715,6 +726,7 @@ def main():
     mods_parser.add_argument('--upgrade', action='store_true', help='Upgrade mods')
     mods_parser.add_argument('--sort', action='store_true', help='Sort mods by type')
     mods_parser.add_argument('--keywords', nargs='+', help='Keywords to search/install mods')
+    mods_parser.add_argument('--popular', action='store_true', help='Install popular mods from Modrinth and CurseForge')
     
     args = parser.parse_args()
     
@@ -9,23 +9,41 @@ import os
 import json
 import subprocess
 import logging
+import threading
+import time
+from collections import deque
 from pathlib import Path
 from datetime import datetime, timedelta
 from typing import Optional, List, Dict, Any
 
-try:
-    from apscheduler.schedulers.background import BackgroundScheduler
-    from apscheduler.triggers.cron import CronTrigger
-    APSCHEDULER_AVAILABLE = True
-except ImportError:
-    APSCHEDULER_AVAILABLE = False
-
 from .config import ServerConfig, load_cfg
 from .constants import CWD
 from .log import log_event
 
 log = logging.getLogger(__name__)
 
+# By default only the tail of ferium's output is kept; an upgrade prints a line per mod
+FERIUM_OUTPUT_LINES = 512
+FERIUM_TIMEOUT = 300
+
+# Upgrade failures whose stderr mentions one of these are worth retrying: dropped
+# connections, HTTP 429 and 5xx ("HTTP status server error (503 ...)")
+_TRANSIENT_ERRORS = ("network", "connection", "error sending request", "429", "too many requests", "server error")
+
+# Our loader names -> ferium's --mod-loader values
+_FERIUM_LOADER_NAMES = {
+    "neoforge": "neo-forge",
+    "fabric": "fabric",
+    "forge": "forge"
+}
+
+
+def _drain_lines(stream, buffer: deque) -> None:
+    """Read a pipe line by line into a bounded buffer until EOF."""
+    with stream:
+        for line in stream:
+            buffer.append(line)
+
 
 class FeriumManager:
     """Manages ferium mod manager integration."""
@@ -36,17 +54,35 @@ class FeriumManager:
         self.ferium_config_dir = Path.home() / ".config" / "ferium"
         self.ferium_config_file = self.ferium_config_dir / "config.json"
         self.scheduler: Optional[Any] = None
+        self._config_dir_ready = False
         
-    def ferium_cmd(self, *args) -> Dict[str, Any]:
-        """Run ferium command and return result."""
+    def ferium_cmd(self, *args, max_lines: Optional[int] = FERIUM_OUTPUT_LINES) -> Dict[str, Any]:
+        """Run ferium command and return result, keeping the last max_lines lines of output (None keeps all)."""
         cmd = [self.ferium_bin] + list(args)
         try:
-            result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+            proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            stdout: deque = deque(maxlen=max_lines)
+            stderr: deque = deque(maxlen=max_lines)
+            readers = [
+                threading.Thread(target=_drain_lines, args=(proc.stdout, stdout), daemon=True),
+                threading.Thread(target=_drain_lines, args=(proc.stderr, stderr), daemon=True)
+            ]
+            for reader in readers:
+                reader.start()
+            try:
+                proc.wait(timeout=FERIUM_TIMEOUT)
+            except subprocess.TimeoutExpired:
+                proc.kill()
+                proc.wait()
+                raise
+            finally:
+                for reader in readers:
+                    reader.join()
             return {
-                "success": result.returncode == 0,
-                "stdout": result.stdout,
-                "stderr": result.stderr,
-                "returncode": result.returncode
+                "success": proc.returncode == 0,
+                "stdout": "".join(stdout),
+                "stderr": "".join(stderr),
+                "returncode": proc.returncode
             }
         except Exception as e:
             return {
@@ -64,15 +100,11 @@ class FeriumManager:
         output_dir: Path
     ) -> bool:
         """Create a ferium profile for the server."""
-        self.ferium_config_dir.mkdir(parents=True, exist_ok=True)
+        if not self._config_dir_ready:
+            self.ferium_config_dir.mkdir(parents=True, exist_ok=True)
+            self._config_dir_ready = True
         
-        # Map loader names
-        loader_map = {
-            "neoforge": "neo-forge",
-            "fabric": "fabric",
-            "forge": "forge"
-        }
-        ferium_loader = loader_map.get(loader.lower(), loader.lower())
+        ferium_loader = _FERIUM_LOADER_NAMES.get(loader.lower(), loader.lower())
         
         log.info(f"[FERIUM] Creating profile: {profile_name}")
         
@@ -87,12 +119,24 @@ class FeriumManager:
         
         if result["success"]:
             log.info(f"[FERIUM] Profile '{profile_name}' created successfully")
-            self.ferium_cmd("profile", "switch", profile_name)
+            # ferium normally activates a profile it just created; only spawn
+            # a second process to switch when its config says otherwise
+            if self._active_profile_name() != profile_name:
+                self.ferium_cmd("profile", "switch", profile_name)
             return True
         else:
             log.error(f"[FERIUM] Failed to create profile: {result.get('stderr', 'Unknown error')}")
             return False
     
+    def _active_profile_name(self) -> Optional[str]:
+        """Name of the active profile according to ferium's config file."""
+        try:
+            with open(self.ferium_config_file, 'r') as f:
+                config = json.load(f)
+            return config["profiles"][config["active_profile"]]["name"]
+        except (OSError, ValueError, KeyError, IndexError, TypeError):
+            return None
+    
     def add_mod(self, mod_slug: str) -> bool:
         """Add a mod from Modrinth by slug."""
         result = self.ferium_cmd("add", mod_slug)
@@ -103,10 +147,44 @@ class FeriumManager:
             log.warning(f"[FERIUM] Failed to add {mod_slug}: {result.get('stderr', 'Unknown error')}")
             return False
     
+    def add_mods(self, mod_slugs: List[str]) -> Dict[str, bool]:
+        """Add several Modrinth mods with a single ferium invocation.
+        
+        Falls back to adding them one at a time if the batch fails, so a single
+        bad slug doesn't block the rest. Returns slug -> whether it was added.
+        """
+        if not mod_slugs:
+            return {}
+        
+        result = self.ferium_cmd("add", *mod_slugs)
+        if result["success"]:
+            for slug in mod_slugs:
+                log.info(f"[FERIUM] Added mod: {slug}")
+            return dict.fromkeys(mod_slugs, True)
+        
+        log.warning(f"[FERIUM] Batch add of {len(mod_slugs)} mods failed, retrying individually")
+        return {slug: self.add_mod(slug) for slug in mod_slugs}
+    
+    def _run_upgrade(self, max_attempts: int = 3) -> Dict[str, Any]:
+        """Run ferium upgrade, retrying with exponential backoff on transient network errors."""
+        for attempt in range(max_attempts):
+            result = self.ferium_cmd("upgrade")
+            if result["success"] or attempt == max_attempts - 1:
+                break
+            # Only ferium's own stderr counts: a wrapper error such as our own
+            # FERIUM_TIMEOUT expiring would just hang again on every attempt
+            output = result.get("stderr", "").lower()
+            if not any(marker in output for marker in _TRANSIENT_ERRORS):
+                break
+            delay = 2 ** attempt
+            log.warning(f"[FERIUM] Upgrade hit a network error, retrying in {delay}s")
+            time.sleep(delay)
+        return result
+    
     def upgrade_mods(self) -> bool:
         """Download/upgrade all mods in current profile."""
         log.info("[FERIUM] Upgrading mods...")
-        result = self.ferium_cmd("upgrade")
+        result = self._run_upgrade()
         if result["success"]:
             log.info("[FERIUM] Mods upgraded successfully")
             return True
@@ -116,7 +194,7 @@ class FeriumManager:
     
     def list_mods(self) -> Optional[str]:
         """List all mods in current profile."""
-        result = self.ferium_cmd("list", "-v")
+        result = self.ferium_cmd("list", "-v", max_lines=None)
         if result["success"]:
             return result["stdout"]
         else:
@@ -126,7 +204,7 @@ class FeriumManager:
     def scan_mods(self, directory: Path) -> bool:
         """Scan directory and auto-add mods to profile."""
         log.info(f"[FERIUM] Scanning directory: {directory}")
-        result = self.ferium_cmd("scan", str(directory), "--force")
+        result = self.ferium_cmd("scan", str(directory), "--force", max_lines=None)
         if result["success"]:
             log.info("[FERIUM] Scan completed")
             return True
@@ -141,7 +219,12 @@ class FeriumManager:
         weekly_update_hour: int = 2
     ) -> bool:
         """Start background scheduler for periodic updates."""
-        if not APSCHEDULER_AVAILABLE:
+        # Imported here so CLI paths that never schedule skip loading APScheduler
+        try:
+            from apscheduler.executors.pool import ThreadPoolExecutor
+            from apscheduler.schedulers.background import BackgroundScheduler
+            from apscheduler.triggers.cron import CronTrigger
+        except ImportError:
             log.warning("[FERIUM_SCHEDULER] APScheduler not available")
             return False
         
@@ -149,7 +232,13 @@ class FeriumManager:
             log.warning("[FERIUM_SCHEDULER] Scheduler already running")
             return False
         
-        self.scheduler = BackgroundScheduler()
+        # One worker per job below (mod_update, weekly_strict_update) is enough; the
+        # default pool allows 10. A job that missed several runs, e.g. across a
+        # suspend, should only run once
+        self.scheduler = BackgroundScheduler(
+            executors={"default": ThreadPoolExecutor(max_workers=2)},
+            job_defaults={"coalesce": True, "max_instances": 1}
+        )
         
         # Validate and clamp update interval
         update_interval_hours = max(1, min(24, int(update_interval_hours)))
@@ -162,20 +251,12 @@ class FeriumManager:
         else:
             hour_expr = f"*/{update_interval_hours}"
         
-        # Every N hours: update Modrinth mods
+        # Every N hours: update Modrinth then CurseForge mods in a single wake-up
         self.scheduler.add_job(
-            self.update_modrinth_mods,
+            self._combined_update,
             CronTrigger(hour=hour_expr),
-            id="modrinth_update",
-            name=f"Update Modrinth mods (every {update_interval_hours}h)"
-        )
-        
-        # Every N hours: update CurseForge mods - offset by 2 minutes
-        self.scheduler.add_job(
-            self.update_curseforge_mods,
-            CronTrigger(hour=hour_expr, minute="2"),
-            id="curseforge_update",
-            name=f"Update CurseForge mods (every {update_interval_hours}h)"
+            id="mod_update",
+            name=f"Update Modrinth and CurseForge mods (every {update_interval_hours}h)"
         )
         
         # Weekly: strict version update check
@@ -202,7 +283,7 @@ class FeriumManager:
         """Scheduled task: Update Modrinth mods via ferium."""
         log_event("FERIUM_TASK", "Running Modrinth update...")
         try:
-            result = self.ferium_cmd("upgrade")
+            result = self._run_upgrade()
             if result["success"]:
                 log_event("FERIUM_TASK", "Modrinth mods upgraded")
             else:
@@ -210,6 +291,11 @@ class FeriumManager:
         except Exception as e:
             log_event("FERIUM_TASK", f"Modrinth update failed: {e}")
     
+    def _combined_update(self):
+        """Scheduled task: Update Modrinth mods, then CurseForge mods."""
+        self.update_modrinth_mods()
+        self.update_curseforge_mods()
+    
     def update_curseforge_mods(self):
         """Scheduled task: Update CurseForge mods."""
         log_event("FERIUM_TASK", "Running CurseForge update...")
@@ -220,7 +306,7 @@ class FeriumManager:
         """Scheduled task: Weekly update with strict version compatibility."""
         log_event("FERIUM_TASK", "Running weekly strict version update...")
         try:
-            result = self.ferium_cmd("upgrade")
+            result = self._run_upgrade()
             if result["success"]:
                 log_event("FERIUM_TASK", "Weekly strict update completed")
             else:
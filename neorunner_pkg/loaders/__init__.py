@@ -3,8 +3,15 @@
 from __future__ import annotations
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+import copy
+import functools
+import hashlib
 import os
 import logging
+import re
+import tempfile
+import threading
 from pathlib import Path
 from typing import Dict, Optional, List, Union, Any
 
@@ -12,6 +19,21 @@ from ..constants import CWD
 
 log = logging.getLogger(__name__)
 
+# Crash logs are re-parsed on every restart attempt; remember the last few results
+CRASH_CACHE_SIZE = 64
+_CRASH_CACHE_MIN_LENGTH = 1024
+_crash_cache: "OrderedDict[tuple, Dict[str, Any]]" = OrderedDict()
+_crash_cache_lock = threading.Lock()
+
+# key=value lines of server.properties, skipping comments and surrounding whitespace
+_PROPERTY_LINE_RE = re.compile(r'^(?![ \t\r\f\v]*#)[ \t\r\f\v]*([^=\n]*)=(.*?)[ \t\r\f\v]*$', re.MULTILINE)
+
+_LOADER_DISPLAY_NAMES = {
+    "neoforge": "NeoForge",
+    "forge": "Forge",
+    "fabric": "Fabric"
+}
+
 
 def _get_cfg_value(cfg: Union[Any, dict], key: str, default: Any = None) -> Any:
     """Get config value from either object or dict with validation for memory values."""
@@ -33,9 +55,95 @@ def _get_cfg_value(cfg: Union[Any, dict], key: str, default: Any = None) -> Any:
     return val if val is not None else default
 
 
+def _atomic_write(path: Union[str, Path], data: str) -> None:
+    """Write text to path via a temp file and rename, so readers never see a torn file."""
+    # A unique temp file in the same directory keeps os.replace on one filesystem
+    # and stops two concurrent writers from sharing the temp file
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(os.fspath(path)) or ".", prefix=".tmp_", suffix=".nr")
+    try:
+        # mkstemp creates files 0600; keep the mode a plain open() would have given
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, 'w', encoding='utf-8', errors='surrogateescape') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+def _write_if_changed(path: Union[str, Path], data: str) -> bool:
+    """Atomically write text to path unless it already holds exactly that content."""
+    # Restarts usually regenerate identical files; skipping the write keeps
+    # their mtime stable and avoids dirtying the page cache
+    try:
+        with open(path, 'rb') as f:
+            if f.read() == data.encode('utf-8', 'surrogateescape'):
+                return False
+    except FileNotFoundError:
+        pass
+    _atomic_write(path, data)
+    return True
+
+
+def _file_stamp(path: Union[str, Path]) -> Optional[tuple]:
+    """Return (mtime_ns, size) of path, or None if it doesn't exist."""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_properties(path: Union[str, Path]) -> Dict[str, str]:
+    """Parse the key=value lines of a .properties file in one regex pass."""
+    # Undecodable bytes round-trip through surrogateescape instead of failing the read
+    with open(path, 'r', encoding='utf-8', errors='surrogateescape') as f:
+        return dict(_PROPERTY_LINE_RE.findall(f.read()))
+
+
+def _cache_crash_reason(method):
+    """Memoize a detect_crash_reason implementation by a digest of the full log text."""
+    @functools.wraps(method)
+    def wrapper(self, log_output):
+        if not isinstance(log_output, str) or len(log_output) <= _CRASH_CACHE_MIN_LENGTH:
+            return method(self, log_output)
+        # Hash the whole log: crash details can sit anywhere in it
+        digest = hashlib.blake2b(log_output.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+        key = (method.__qualname__, digest)
+        with _crash_cache_lock:
+            result = _crash_cache.get(key)
+            if result is not None:
+                _crash_cache.move_to_end(key)
+        if result is None:
+            result = method(self, log_output)
+            with _crash_cache_lock:
+                _crash_cache[key] = result
+                if len(_crash_cache) > CRASH_CACHE_SIZE:
+                    _crash_cache.popitem(last=False)
+        # Callers get their own copy so they can't alter the cached entry
+        return copy.deepcopy(result)
+    return wrapper
+
+
+def clear_crash_cache() -> None:
+    """Forget all memoized crash log results."""
+    with _crash_cache_lock:
+        _crash_cache.clear()
+
+
 class LoaderBase(ABC):
     """Abstract base class for modloader implementations."""
     
+    # (xmx, xms, file stamp) as of the last user_jvm_args.txt written or checked
+    _jvm_args_state: Optional[tuple] = None
+    
     def __init__(self, cfg: Any, cwd: Optional[Path] = None):
         self.cfg = cfg
         self.cwd = cwd or CWD
@@ -64,6 +172,7 @@ class LoaderBase(ABC):
             Dictionary with keys:
             - type: 'missing_dep' | 'mod_error' | 'mod_conflict' | 'version_mismatch' | 'benign_mixin_warning' | 'unknown'
             - dep: name of missing dependency (for missing_dep)
+            - deps: every missing dependency found, in log order (for missing_dep, if the loader collects them)
             - culprit: mod ID that caused the crash (if identifiable)
             - culprits: list of all involved mod IDs
             - message: relevant portion of the crash log
@@ -71,12 +180,7 @@ class LoaderBase(ABC):
     
     def get_loader_display_name(self) -> str:
         """Return display name for the loader."""
-        names = {
-            "neoforge": "NeoForge",
-            "forge": "Forge",
-            "fabric": "Fabric"
-        }
-        return names.get(self.loader_name, self.loader_name.title())
+        return _LOADER_DISPLAY_NAMES.get(self.loader_name, self.loader_name.title())
 
 
 def get_loader(cfg: Any, cwd: Optional[Path] = None) -> LoaderBase:
@@ -103,6 +207,7 @@ def get_loader(cfg: Any, cwd: Optional[Path] = None) -> LoaderBase:
 __all__ = [
     "LoaderBase",
     "get_loader",
+    "clear_crash_cache",
     "NeoForgeLoader",
     "ForgeLoader", 
     "FabricLoader",
@@ -5,12 +5,33 @@ from __future__ import annotations
 import os
 import re
 import subprocess
+import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
-from . import LoaderBase, _get_cfg_value
+from . import LoaderBase, _cache_crash_reason, _file_stamp, _get_cfg_value, _read_properties, _write_if_changed
 from ..log import log_event
 
+_MOD_ID = r'[\w.\-]+'
+
+# Missing-dependency phrasings, each capturing the dependency id in its only group
+_MISSING_DEP_PATTERNS = (
+    r"requires?\s+(?:any\s+version\s+of\s+)?(" + _MOD_ID + r")",
+    r"unmet\s+dependency[:\s]+(" + _MOD_ID + r")",
+    r"missing\s+(?:mod|dependency)[:\s]+(" + _MOD_ID + r")",
+    r"resolution\s+failed\s+for\s+(" + _MOD_ID + r")",
+)
+# All of the above as one alternation, compiled once at import, so a single
+# finditer pass collects every missing dependency in log order
+_MISSING_DEP_RE = re.compile("|".join(_MISSING_DEP_PATTERNS), re.IGNORECASE)
+_VERSION_RE = re.compile(r"version", re.IGNORECASE)
+_MISMATCH_RE = re.compile(r"mismatch|incompatible", re.IGNORECASE)
+_ERROR_RE = re.compile(r"error", re.IGNORECASE)
+_LOADER_KEYWORD_RE = re.compile(r"fabric|loader|modloading", re.IGNORECASE)
+
+# Fabric prints its dependency resolution errors at the end of the log
+_CRASH_LOG_TAIL = 65536
+
 
 class FabricLoader(LoaderBase):
     """Fabric-specific server launcher and management."""
@@ -47,19 +68,22 @@ class FabricLoader(LoaderBase):
         """Create user_jvm_args.txt with memory and performance settings."""
         jvm_file = self.cwd / "user_jvm_args.txt" if isinstance(self.cwd, Path) else os.path.join(self.cwd, "user_jvm_args.txt")
         
-        if os.path.exists(jvm_file) and not self._validate_jvm_args(jvm_file):
-            os.remove(jvm_file)
-        
         xmx = _get_cfg_value(self.cfg, "xmx", "6G")
         xms = _get_cfg_value(self.cfg, "xms", "4G")
+        # Same settings and the file untouched since we last wrote it: nothing to redo
+        if self._jvm_args_state == (xmx, xms, _file_stamp(jvm_file)):
+            return
+        
+        if os.path.exists(jvm_file) and not self._validate_jvm_args(jvm_file):
+            os.remove(jvm_file)
         
         jvm_args = f"""-Xmx{xmx}
 -Xms{xms}
 -Dfabric.logging.debugNetwork=true
 -Dlog4j.logger.net.fabricmc=DEBUG
 """
-        with open(jvm_file, 'w') as f:
-            f.write(jvm_args)
+        _write_if_changed(jvm_file, jvm_args)
+        self._jvm_args_state = (xmx, xms, _file_stamp(jvm_file))
     
     def _setup_server_properties(self) -> None:
         """Setup server.properties."""
@@ -75,29 +99,26 @@ class FabricLoader(LoaderBase):
         }
         
         if os.path.exists(props_file):
-            existing = {}
-            try:
-                with open(props_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            if '=' in line:
-                                k, v = line.split('=', 1)
-                                existing[k] = v
-            except Exception:
-                pass
+            # Read errors propagate rather than the user's settings getting replaced by the defaults
+            existing = _read_properties(props_file)
+            # Existing values win the merge, so if every default key is already
+            # present the rewrite would produce the same properties; skip it
+            if existing.keys() >= properties.keys():
+                return
             properties.update(existing)
         
-        with open(props_file, 'w') as f:
-            for k, v in sorted(properties.items()):
-                f.write(f"{k}={v}\n")
+        _write_if_changed(props_file, "".join(f"{k}={v}\n" for k, v in sorted(properties.items())))
     
     def _setup_eula(self) -> None:
         """Create eula.txt."""
         eula_file = self.cwd / "eula.txt" if isinstance(self.cwd, Path) else os.path.join(self.cwd, "eula.txt")
-        if not os.path.exists(eula_file):
-            with open(eula_file, 'w') as f:
-                f.write("eula=true\n")
+        # O_EXCL folds the existence check into the create: one syscall, no race
+        try:
+            fd = os.open(eula_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return
+        with os.fdopen(fd, 'w') as f:
+            f.write("eula=true\n")
     
     def build_java_command(self) -> List[str]:
         """Build Fabric launch command."""
@@ -123,48 +144,45 @@ class FabricLoader(LoaderBase):
         ]
         return java_cmd
     
+    @_cache_crash_reason
     def detect_crash_reason(self, log_output: str) -> Dict[str, Any]:
         """Parse Fabric crash logs."""
-        log_text = log_output.lower() if isinstance(log_output, str) else ""
-        MOD_ID = r'[\w.\-]+'
-        
-        missing_patterns = [
-            (r"requires?\s+(?:any\s+version\s+of\s+)?(" + MOD_ID + r")", 1),
-            (r"unmet\s+dependency[:\s]+(" + MOD_ID + r")", 1),
-            (r"missing\s+(?:mod|dependency)[:\s]+(" + MOD_ID + r")", 1),
-            (r"resolution\s+failed\s+for\s+(" + MOD_ID + r")", 1),
-        ]
+        # Match case-insensitively on the tail rather than lowercasing a copy of the whole log
+        log_text = log_output[-_CRASH_LOG_TAIL:] if isinstance(log_output, str) else ""
+        message = log_text[:500].lower()
         
-        for pattern, dep_group in missing_patterns:
-            match = re.search(pattern, log_text)
-            if match:
-                return {
-                    "type": "missing_dep",
-                    "dep": match.group(dep_group),
-                    "culprit": None,
-                    "culprits": [],
-                    "message": log_text[:500]
-                }
+        # Report every missing dependency at once so they can be installed in one
+        # restart cycle instead of one restart per dependency
+        deps = list(dict.fromkeys(sys.intern(m.group(m.lastindex).lower()) for m in _MISSING_DEP_RE.finditer(log_text)))
+        if deps:
+            return {
+                "type": "missing_dep",
+                "dep": deps[0],
+                "deps": deps,
+                "culprit": None,
+                "culprits": [],
+                "message": message
+            }
         
-        if "version" in log_text and ("mismatch" in log_text or "incompatible" in log_text):
+        if _VERSION_RE.search(log_text) and _MISMATCH_RE.search(log_text):
             return {
                 "type": "version_mismatch",
                 "culprit": None,
                 "culprits": [],
-                "message": log_text[:500]
+                "message": message
             }
         
-        if "error" in log_text and any(kw in log_text for kw in ["fabric", "loader", "modloading"]):
+        if _ERROR_RE.search(log_text) and _LOADER_KEYWORD_RE.search(log_text):
             return {
                 "type": "mod_error",
                 "culprit": None,
                 "culprits": [],
-                "message": log_text[:500]
+                "message": message
             }
         
         return {
             "type": "unknown",
             "culprit": None,
             "culprits": [],
-            "message": log_text[:500]
+            "message": message
         }
@@ -5,12 +5,23 @@ from __future__ import annotations
 import os
 import re
 import subprocess
+import sys
 from pathlib import Path
 from typing import Any, Dict, List
 
-from . import LoaderBase, _get_cfg_value
+from . import LoaderBase, _cache_crash_reason, _file_stamp, _get_cfg_value, _read_properties, _write_if_changed
 from ..log import log_event
 
+_MOD_ID = r'[\w.\-]+'
+
+# Missing-dependency patterns and the group holding the dependency id, compiled once at import
+_MISSING_DEP_PATTERNS = (
+    (re.compile(r"requires?\s+(" + _MOD_ID + r")\s+(?:but|not\s+found|[0-9.])"), 1),
+    (re.compile(r"missing\s+(?:mandatory\s+)?dependenc(?:y|ies)[:\s]+(" + _MOD_ID + r")"), 1),
+    (re.compile(r"could\s+not\s+find\s+(?:required\s+mod[:\s]+)?(" + _MOD_ID + r")"), 1),
+)
+_LOADER_KEYWORDS = ("fml", "forge", "modloading")
+
 
 class ForgeLoader(LoaderBase):
     """Forge-specific server launcher and management."""
@@ -47,11 +58,14 @@ class ForgeLoader(LoaderBase):
         """Create user_jvm_args.txt with memory and performance settings."""
         jvm_file = self.cwd / "user_jvm_args.txt" if isinstance(self.cwd, Path) else os.path.join(self.cwd, "user_jvm_args.txt")
         
-        if os.path.exists(jvm_file) and not self._validate_jvm_args(jvm_file):
-            os.remove(jvm_file)
-        
         xmx = _get_cfg_value(self.cfg, "xmx", "6G")
         xms = _get_cfg_value(self.cfg, "xms", "4G")
+        # Same settings and the file untouched since we last wrote it: nothing to redo
+        if self._jvm_args_state == (xmx, xms, _file_stamp(jvm_file)):
+            return
+        
+        if os.path.exists(jvm_file) and not self._validate_jvm_args(jvm_file):
+            os.remove(jvm_file)
         
         jvm_args = f"""-Xmx{xmx}
 -Xms{xms}
@@ -71,8 +85,8 @@ class ForgeLoader(LoaderBase):
 -Dforge.logging.console.level=DEBUG
 -Dfml.query.verbose=true
 """
-        with open(jvm_file, 'w') as f:
-            f.write(jvm_args)
+        _write_if_changed(jvm_file, jvm_args)
+        self._jvm_args_state = (xmx, xms, _file_stamp(jvm_file))
     
     def _setup_server_properties(self) -> None:
         """Setup server.properties."""
@@ -88,29 +102,21 @@ class ForgeLoader(LoaderBase):
         }
         
         if os.path.exists(props_file):
-            existing = {}
-            try:
-                with open(props_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            if '=' in line:
-                                k, v = line.split('=', 1)
-                                existing[k] = v
-            except Exception:
-                pass
-            properties.update(existing)
+            # Read errors propagate rather than the user's settings getting replaced by the defaults
+            properties.update(_read_properties(props_file))
         
-        with open(props_file, 'w') as f:
-            for k, v in sorted(properties.items()):
-                f.write(f"{k}={v}\n")
+        _write_if_changed(props_file, "".join(f"{k}={v}\n" for k, v in sorted(properties.items())))
     
     def _setup_eula(self) -> None:
         """Create eula.txt."""
         eula_file = self.cwd / "eula.txt" if isinstance(self.cwd, Path) else os.path.join(self.cwd, "eula.txt")
-        if not os.path.exists(eula_file):
-            with open(eula_file, 'w') as f:
-                f.write("eula=true\n")
+        # O_EXCL folds the existence check into the create: one syscall, no race
+        try:
+            fd = os.open(eula_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return
+        with os.fdopen(fd, 'w') as f:
+            f.write("eula=true\n")
     
     def build_java_command(self) -> List[str]:
         """Build Forge launch command."""
@@ -136,23 +142,17 @@ class ForgeLoader(LoaderBase):
         ]
         return java_cmd
     
+    @_cache_crash_reason
     def detect_crash_reason(self, log_output: str) -> Dict[str, Any]:
         """Parse Forge crash logs."""
         log_text = log_output.lower() if isinstance(log_output, str) else ""
-        MOD_ID = r'[\w.\-]+'
-        
-        missing_patterns = [
-            (r"requires?\s+(" + MOD_ID + r")\s+(?:but|not\s+found|[0-9.])", 1),
-            (r"missing\s+(?:mandatory\s+)?dependenc(?:y|ies)[:\s]+(" + MOD_ID + r")", 1),
-            (r"could\s+not\s+find\s+(?:required\s+mod[:\s]+)?(" + MOD_ID + r")", 1),
-        ]
         
-        for pattern, dep_group in missing_patterns:
-            match = re.search(pattern, log_text)
+        for pattern, dep_group in _MISSING_DEP_PATTERNS:
+            match = pattern.search(log_text)
             if match:
                 return {
                     "type": "missing_dep",
-                    "dep": match.group(dep_group),
+                    "dep": sys.intern(match.group(dep_group)),
                     "culprit": None,
                     "culprits": [],
                     "message": log_text[:500]
@@ -166,7 +166,7 @@ class ForgeLoader(LoaderBase):
                 "message": log_text[:500]
             }
         
-        if "error" in log_text and any(kw in log_text for kw in ["fml", "forge", "modloading"]):
+        if "error" in log_text and any(kw in log_text for kw in _LOADER_KEYWORDS):
             return {
                 "type": "mod_error",
                 "culprit": None,
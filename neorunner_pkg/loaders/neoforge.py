@@ -2,15 +2,170 @@
 
 from __future__ import annotations
 
+import functools
 import os
 import re
 import subprocess
+import sys
 from pathlib import Path
+from types import SimpleNamespace
 from typing import Dict, List, Optional, Any
 
-from . import LoaderBase, _get_cfg_value
+from . import LoaderBase, _cache_crash_reason, _file_stamp, _get_cfg_value, _read_properties, _write_if_changed
 from ..log import log_event
 
+_MOD_ID = r'[\w.\-]+'
+
+_FML_ERROR_MARKERS = (
+    "net.neoforged.fml.modloadingexception",
+    "loadingexceptionmodcrash",
+    "fml detected errors during loading",
+)
+_VERSION_NUMBER_RE = re.compile(r'\d+')
+
+
+@functools.lru_cache(maxsize=None)
+def _crash_patterns() -> SimpleNamespace:
+    """Compile the crash-log patterns on first use; most runs never parse a crash.
+    
+    They are all lowercase and run against the lowercased log: re.IGNORECASE would
+    disable sre's fast literal-prefix scan, which costs far more than one lower() copy.
+    """
+    return SimpleNamespace(
+        bad_jar=re.compile(r'file\s+mods/(\S+\.jar)\s+is\s+not\s+a\s+jar\s+file'),
+        jar_version_suffix=re.compile(r'[-_]?\d.*$'),
+        mixin_client=re.compile(r"mixintransformererror|mixinpreprocessorexception.*from\s+mod\s+(" + _MOD_ID + r")"),
+        client_class_load=re.compile(r"error\s+loading\s+class:.*client"),
+        # The one exception: searched in the original text, so only a lowercase "from mod" counts
+        from_mod=re.compile(r"from\s+mod\s+(" + _MOD_ID + r")"),
+        # Each pattern is searched separately: sre finds a literal prefix with a fast
+        # substring scan, which an alternation of different prefixes gives up
+        client_class=tuple(re.compile(p) for p in (
+            r"noclassdeffounderror:\s+net/minecraft/client/",
+            r"classnotfoundexception:\s+net\.minecraft\.client\.",
+            r"noclassdeffounderror:\s+com/mojang/blaze3d/",
+            r"classnotfoundexception:\s+com\.mojang\.blaze3d\.",
+        )),
+        client_fail=tuple(re.compile(p) for p in (
+            r"failed\s+to\s+create\s+mod\s+instance\.\s*modid:\s*(" + _MOD_ID + r")",
+            r"modid:\s*(" + _MOD_ID + r")[^\n]*noclassdeffounderror",
+            r"\[(" + _MOD_ID + r")\][^\n]*failed",
+        )),
+        mods_jar=re.compile(r"mods/([^\s/]*\.jar)"),
+        mod_file_jar=re.compile(r"mod\s+file:\s+\S*mods/(\S+\.jar)"),
+        # (pattern, culprit group, dependency group), in priority order. "failure message:
+        # mod X requires Y" and "missing dependency: X" are already caught by the "mod X
+        # requires Y" and "missing ... dependency" patterns ahead of them
+        missing_dep=(
+            (re.compile(r"mod\s+(" + _MOD_ID + r")\s+requires?\s+(" + _MOD_ID + r")"), 1, 2),
+            (re.compile(r"missing\s+(?:or\s+unsupported\s+)?(?:mandatory\s+)?dependenc(?:y|ies)[:\s]+(" + _MOD_ID + r")"), None, 1),
+            (re.compile(r"could\s+not\s+find\s+(?:required\s+mod[:\s]+)?(" + _MOD_ID + r")"), None, 1),
+            (re.compile(r"mod\s+file\s+\S+\s+needs\s+(" + _MOD_ID + r")"), None, 1),
+        ),
+        # (pattern, conflict type). The benign mixin overwrite comes first so a handled
+        # overwrite is never reported as a real conflict
+        conflict=(
+            (re.compile(
+                r"overwrite\s+conflict\s+for\s+(\S+)\s+in\s+(\S+)\s+from\s+(?:mod\s+)?(" + _MOD_ID + r")[\s,].*?"
+                r"previously\s+(?:written|defined)\s+by\s+(.+?)\.?\s+skipping\s+method\.?"
+            ), "benign_mixin"),
+            (re.compile(r"duplicatemodsfoundexception.*?(\S+\.jar).*?(\S+\.jar)"), "duplicate"),
+            (re.compile(r"duplicate\s+(?:registry\s+)?(?:key|entry|id)[:\s]+(" + _MOD_ID + r"[:/]" + _MOD_ID + r")"), "registry"),
+            (re.compile(r"(" + _MOD_ID + r"[:/]" + _MOD_ID + r")\s+is\s+already\s+registered"), "registry"),
+            (re.compile(r"mixin\s+apply\s+for\s+mod\s+(" + _MOD_ID + r")\s+failed"), "mixin_fail"),
+            (re.compile(r"mixinapplyerror.*?mod[:\s]+(" + _MOD_ID + r")"), "mixin_fail"),
+            (re.compile(r"mixintransformererror.*?from\s+mod\s+(" + _MOD_ID + r")"), "mixin_error"),
+            (re.compile(r"incompatible\s+mod(?:s)?\s+(?:set|found|detected)"), "incompatible"),
+            (re.compile(r"(" + _MOD_ID + r")\s+conflicts?\s+with\s+(" + _MOD_ID + r")"), "conflict"),
+        ),
+        # (pattern, culprit group)
+        mod_error=(
+            (re.compile(r"error\s+loading\s+mod[:\s]+(" + _MOD_ID + r")"), 1),
+            (re.compile(r"mod\s+(" + _MOD_ID + r")\s+has\s+crashed"), 1),
+            (re.compile(r"exception\s+.*?mod[:\s]+(" + _MOD_ID + r")"), 1),
+            (re.compile(r"caused\s+by\s+mod[:\s]+(" + _MOD_ID + r")"), 1),
+            (re.compile(r"modloadingexception.*?(" + _MOD_ID + r")"), 1),
+            (re.compile(r"mod\s+\S+\s+\((" + _MOD_ID + r")\)\s+encountered\s+an?\s+error"), 1),
+        ),
+        stack_frame=re.compile(r"at\s+(?:com|net|dev|io|org)\.([\w]+)\.([\w]+)\."),
+    )
+
+
+# A word that every pattern in the category needs to match. When a log
+# contains none of them the whole category is skipped with a few substring
+# checks. Several of its patterns open with a character class, and those
+# otherwise cost a regex attempt at every position of the log.
+_CATEGORY_KEYWORDS = {
+    "missing_dep": ("require", "dependenc", "could", "needs"),
+    "conflict": ("conflict", "duplicate", "already", "mixin", "incompatible"),
+    "mod_error": ("loading", "crashed", "exception", "caused", "encountered"),
+}
+# Every result other than "unknown" needs at least one of these words, most common first
+_CRASH_KEYWORDS = (
+    "error", "exception", "crash", "version", "loading", "mixin", "require", "dependenc",
+    "could", "needs", "class", "jar", "overwrite", "duplicate", "already", "incompatible",
+    "conflict", "caused", "encountered"
+)
+# Package segments that never name a mod when reading a mixin class path
+_MIXIN_SKIP_WORDS = frozenset({
+    'mixin', 'mixins', 'common', 'client', 'server', 'api', 'impl', 'core', 'internal', 'util',
+    'handler', 'access', 'wrapper', 'hook', 'patch', 'transform', 'chunk', 'world', 'entity',
+    'block', 'item', 'screen', 'container', 'packet', 'network', 'data', 'config'
+})
+_MIXIN_TLD_WORDS = frozenset({'dev', 'com', 'org', 'net', 'io', 'me', 'xyz'})
+_NOT_A_CULPRIT = ("minecraft", "neoforge", "fml", "forge", "java", "net")
+_FRAMEWORK_PKGS = frozenset({
+    "mojang", "minecraft", "neoforged", "neoforge", "cpw", "fml",
+    "google", "gson", "apache", "netty", "oshi", "slf4j", "log4j",
+    "java", "sun", "jdk", "spongepowered", "mixin"
+})
+
+
+def _jar_slug(jar_name: str) -> str:
+    """Mod slug from a jar file name: drop '.jar' and the version suffix, lowercased."""
+    return sys.intern(_crash_patterns().jar_version_suffix.sub('', jar_name.replace('.jar', '')).lower())
+
+
+def _find_mod_jar(mod_jars: List[str], mod_id: str) -> Optional[str]:
+    """First jar (from the mods_jar pattern) whose name contains mod_id before its .jar extension."""
+    for jar in mod_jars:
+        if mod_id in jar[:-4]:
+            return jar
+    return None
+
+
+def _extract_mod_id_from_mixin_path(path_or_id: Optional[str]) -> Optional[str]:
+    """Guess the mod ID from a mixin class path such as com.author.mymod.mixin.FooMixin."""
+    if not path_or_id:
+        return None
+    s = path_or_id.lower().strip()
+    if '.' not in s:
+        return s
+    parts = s.split('.')
+    mixin_idx = -1
+    for i, part in enumerate(parts):
+        if 'mixin' in part:
+            mixin_idx = i
+            break
+    if mixin_idx > 0:
+        for i in range(mixin_idx - 1, -1, -1):
+            part = parts[i]
+            if part in _MIXIN_SKIP_WORDS or part in _MIXIN_TLD_WORDS:
+                continue
+            if len(part) >= 3:
+                return part
+    for part in reversed(parts):
+        if part in _MIXIN_SKIP_WORDS:
+            continue
+        if len(part) >= 3 and not part.startswith('class') and not part.startswith('mixin'):
+            return part
+    return parts[-1] if parts else s
+
+
+def _version_key(version: str) -> tuple:
+    """Sort key comparing version strings numerically, so 21.1.10 sorts after 21.1.9."""
+    return tuple(int(n) for n in _VERSION_NUMBER_RE.findall(version)), version
+
 
 class NeoForgeLoader(LoaderBase):
     """NeoForge-specific server launcher and management."""
@@ -57,20 +212,17 @@ class NeoForgeLoader(LoaderBase):
             xmx = '4G'
         if not (xms.endswith('G') or xms.endswith('M')):
             xms = '2G'
+        # Same settings and the file untouched since we last wrote it: nothing to redo
+        if self._jvm_args_state == (xmx, xms, _file_stamp(jvm_file)):
+            return
         
         jvm_args = f"""-Xmx{xmx}
 -Xms{xms}
 -XX:+UseG1GC
 -Djava.net.preferIPv4Stack=true
 """
-        with open(jvm_file, 'w') as f:
-            f.write(jvm_args)
-        
-        with open(jvm_file) as f:
-            content = f.read()
-        if 'echo' in content or 'Dashboard' in content:
-            with open(jvm_file, 'w') as f:
-                f.write(f"-Xmx{xmx}\n-Xms{xms}\n-XX:+UseG1GC\n-Djava.net.preferIPv4Stack=true\n")
+        _write_if_changed(jvm_file, jvm_args)
+        self._jvm_args_state = (xmx, xms, _file_stamp(jvm_file))
         
         log_event("LOADER_NEOFORGE", f"Created user_jvm_args.txt: {xmx}/{xms}")
     
@@ -85,17 +237,13 @@ class NeoForgeLoader(LoaderBase):
         # Check for world regeneration needed
         world_dir = self.cwd / "world" if isinstance(self.cwd, Path) else os.path.join(self.cwd, "world")
         mc_ver = self.mc_version if hasattr(self, 'mc_version') else "1.21"
-        props_mc_ver = None
         
+        # Parse the existing file once; it's merged into the defaults below. Read errors
+        # propagate rather than the user's settings getting replaced by the defaults
+        existing = {}
         if os.path.exists(props_file):
-            try:
-                with open(props_file) as f:
-                    for line in f:
-                        line = line.strip()
-                        if line.startswith("level-name="):
-                            props_mc_ver = line.split("=", 1)[1]
-            except Exception:
-                pass
+            existing = _read_properties(props_file)
+        props_mc_ver = existing.get("level-name")
         
         # Check version compatibility
         old_world_marker = os.path.join(self.cwd, "world", "version" if isinstance(self.cwd, Path) else "world/version")
@@ -144,35 +292,25 @@ class NeoForgeLoader(LoaderBase):
             "simulation-distance": sim_dist,
         }
         
-        existing = {}
-        if os.path.exists(props_file):
-            try:
-                with open(props_file, 'r') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            if '=' in line:
-                                k, v = line.split('=', 1)
-                                existing[k] = v
-            except Exception:
-                pass
-            properties.update(existing)
+        properties.update(existing)
         
         if not existing.get("enable-rcon"):
             properties["enable-rcon"] = "true"
             properties["rcon.password"] = _get_cfg_value(self.cfg, "rcon_pass", "changeme")
             properties["rcon.port"] = str(_get_cfg_value(self.cfg, "rcon_port", 25575))
         
-        with open(props_file, 'w') as f:
-            for k, v in sorted(properties.items()):
-                f.write(f"{k}={v}\n")
+        _write_if_changed(props_file, "".join(f"{k}={v}\n" for k, v in sorted(properties.items())))
     
     def _setup_eula(self) -> None:
         """Create eula.txt."""
         eula_file = self.cwd / "eula.txt" if isinstance(self.cwd, Path) else os.path.join(self.cwd, "eula.txt")
-        if not os.path.exists(eula_file):
-            with open(eula_file, 'w') as f:
-                f.write("eula=true\n")
+        # O_EXCL folds the existence check into the create: one syscall, no race
+        try:
+            fd = os.open(eula_file, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o644)
+        except FileExistsError:
+            return
+        with os.fdopen(fd, 'w') as f:
+            f.write("eula=true\n")
     
     def build_java_command(self) -> List[str]:
         """Build NeoForge launch command."""
@@ -233,21 +371,32 @@ class NeoForgeLoader(LoaderBase):
     def _get_neoforge_version(self) -> str:
         """Get NeoForge version - prefer local libraries, fallback to dynamic fetch."""
         lib_path = self.cwd / "libraries" / "net" / "neoforged" / "neoforge" if isinstance(self.cwd, Path) else os.path.join(self.cwd, "libraries/net/neoforged/neoforge")
-        if os.path.exists(lib_path):
-            versions = [d for d in os.listdir(lib_path) if os.path.isdir(os.path.join(lib_path, d))]
-            if versions:
-                # Pick version matching mc_version, or latest
-                mc_ver = self.mc_version if hasattr(self, 'mc_version') else ""
-                mc_major = mc_ver.split(".")[1] if "." in mc_ver else "21"
-                for v in sorted(versions, reverse=True):
-                    if v.startswith(f"{mc_major}."):
-                        jar_path = os.path.join(lib_path, v, f"neoforge-{v}-universal.jar")
-                        if os.path.exists(jar_path):
-                            return v
-                latest = sorted(versions)[-1]
-                jar_path = os.path.join(lib_path, latest, f"neoforge-{latest}-universal.jar")
-                if os.path.exists(jar_path):
-                    return latest
+        mc_ver = self.mc_version if hasattr(self, 'mc_version') else ""
+        mc_major = mc_ver.split(".")[1] if "." in mc_ver else "21"
+        
+        # One scandir pass (d_type, no stat per entry) tracking the newest version
+        # overall and the newest one for this MC version that has its universal jar
+        latest = None
+        matching = None
+        try:
+            with os.scandir(lib_path) as entries:
+                for entry in entries:
+                    if not entry.is_dir():
+                        continue
+                    key = _version_key(entry.name)
+                    if latest is None or key > latest[0]:
+                        latest = (key, entry.name)
+                    if (entry.name.startswith(f"{mc_major}.")
+                            and (matching is None or key > matching[0])
+                            and os.path.exists(os.path.join(entry.path, f"neoforge-{entry.name}-universal.jar"))):
+                        matching = (key, entry.name)
+        except OSError:
+            pass
+        
+        if matching:
+            return matching[1]
+        if latest and os.path.exists(os.path.join(lib_path, latest[1], f"neoforge-{latest[1]}-universal.jar")):
+            return latest[1]
         
         # Fallback: fetch dynamically from Maven
         from ..version import get_latest_for_loader
@@ -256,6 +405,7 @@ class NeoForgeLoader(LoaderBase):
             return latest.split("-")[0] if "-" in latest else latest
         return None
     
+    @_cache_crash_reason
     def detect_crash_reason(self, log_output: str) -> Dict[str, Any]:
         """Parse NeoForge crash logs for common issues.
         
@@ -267,30 +417,45 @@ class NeoForgeLoader(LoaderBase):
             - message: relevant portion of the crash log
         """
         log_text = log_output if isinstance(log_output, str) else ""
+        if not log_text:
+            return {
+                "type": "unknown",
+                "culprit": None,
+                "culprits": [],
+                "message": ""
+            }
         log_lower = log_text.lower()
         
-        crash_section = log_text
+        # Only the first 2000 chars of the section are ever reported, so slice
+        # just those rather than copying everything after the marker
         crash_marker = log_text.find("---- Minecraft Crash Report ----")
-        if crash_marker >= 0:
-            crash_section = log_text[crash_marker:]
+        crash_start = crash_marker if crash_marker >= 0 else 0
+        crash_section = log_text[crash_start:crash_start + 2000]
         
         fml_error = ""
-        for marker in ["net.neoforged.fml.ModLoadingException", 
-                        "LoadingExceptionModCrash",
-                        "FML detected errors during loading"]:
-            idx = log_lower.find(marker.lower())
+        for marker in _FML_ERROR_MARKERS:
+            idx = log_lower.find(marker)
             if idx >= 0:
                 fml_error = log_text[max(0, idx - 200):idx + 1000]
                 break
         
-        relevant_log = fml_error or crash_section[:2000] or log_text[-2000:]
+        relevant_log = fml_error or crash_section or log_text[-2000:]
         
-        MOD_ID = r'[\w.\-]+'
+        # Routine output (startup polling, clean logs) can't match anything below
+        if not any(kw in log_lower for kw in _CRASH_KEYWORDS):
+            return {
+                "type": "unknown",
+                "culprit": None,
+                "culprits": [],
+                "message": relevant_log[:1000]
+            }
         
-        bad_jar_match = re.search(r'file\s+mods/(\S+\.jar)\s+is\s+not\s+a\s+jar\s+file', log_lower)
+        patterns = _crash_patterns()
+        
+        bad_jar_match = patterns.bad_jar.search(log_lower)
         if bad_jar_match:
             bad_file = bad_jar_match.group(1)
-            slug = re.sub(r'[-_]?\d.*$', '', bad_file.replace('.jar', '')).lower()
+            slug = _jar_slug(bad_file)
             return {
                 "type": "mod_error",
                 "culprit": slug or bad_file,
@@ -299,16 +464,11 @@ class NeoForgeLoader(LoaderBase):
                 "bad_file": bad_file
             }
         
-        mixin_client_match = re.search(r"mixintransformererror|MixinPreProcessorException.*from\s+mod\s+(" + MOD_ID + r")", log_text, re.IGNORECASE)
-        if mixin_client_match or (re.search(r"error\s+loading\s+class:.*client", log_lower) and re.search(r"from\s+mod\s+(" + MOD_ID + r")", log_text)):
-            from_mod_match = re.search(r"from\s+mod\s+(" + MOD_ID + r")", log_text)
-            culprit_mod = from_mod_match.group(1).lower() if from_mod_match else None
-            culprit_file = None
-            if culprit_mod:
-                jar_pattern = rf"mods/([^\s/]*{re.escape(culprit_mod)}[^\s/]*\.jar)"
-                jar_match = re.search(jar_pattern, log_lower)
-                if jar_match:
-                    culprit_file = jar_match.group(1)
+        mixin_client_match = patterns.mixin_client.search(log_lower)
+        if mixin_client_match or (patterns.client_class_load.search(log_lower) and patterns.from_mod.search(log_text)):
+            from_mod_match = patterns.from_mod.search(log_text)
+            culprit_mod = sys.intern(from_mod_match.group(1).lower()) if from_mod_match else None
+            culprit_file = _find_mod_jar(patterns.mods_jar.findall(log_lower), culprit_mod) if culprit_mod else None
             return {
                 "type": "mod_error",
                 "subtype": "client_only",
@@ -318,48 +478,33 @@ class NeoForgeLoader(LoaderBase):
                 "bad_file": culprit_file
             }
         
-        client_class_patterns = [
-            r"noclassdeffounderror:\s+net/minecraft/client/",
-            r"classnotfoundexception:\s+net\.minecraft\.client\.",
-            r"noclassdeffounderror:\s+com/mojang/blaze3d/",
-            r"classnotfoundexception:\s+com\.mojang\.blaze3d\.",
-            r"noclassdeffounderror:\s+net/minecraft/client/sounds/",
-        ]
-        
-        all_client_crashes = []
-        for cp in client_class_patterns:
-            if re.search(cp, log_lower):
-                fail_patterns = [
-                    r"failed\s+to\s+create\s+mod\s+instance\.\s*modid:\s*(" + MOD_ID + r")",
-                    r"modid:\s*(" + MOD_ID + r")[^\n]*noclassdeffounderror",
-                    r"\[(" + MOD_ID + r")\][^\n]*failed",
-                ]
-                for fp in fail_patterns:
-                    for match in re.finditer(fp, log_lower):
-                        mod_id = match.group(1)
-                        if mod_id not in all_client_crashes:
-                            all_client_crashes.append(mod_id)
+        # Insertion-ordered dict as an ordered set: O(1) duplicate checks
+        client_crashes: Dict[str, None] = {}
+        for cp in patterns.client_class:
+            if cp.search(log_lower):
+                for fp in patterns.client_fail:
+                    for match in fp.finditer(log_lower):
+                        client_crashes.setdefault(sys.intern(match.group(1)))
                 
-                for match in re.finditer(r"mod\s+file:\s+\S*mods/(\S+\.jar)", log_lower):
-                    culprit_file = match.group(1)
-                    culprit_mod = re.sub(r'[-_]?\d.*$', '', culprit_file.replace('.jar', '')).lower()
-                    if culprit_mod and culprit_mod not in all_client_crashes:
-                        all_client_crashes.append(culprit_mod)
+                for match in patterns.mod_file_jar.finditer(log_lower):
+                    culprit_mod = _jar_slug(match.group(1))
+                    if culprit_mod:
+                        client_crashes.setdefault(culprit_mod)
                 
-                for match in re.finditer(r"from\s+mod\s+(" + MOD_ID + r")", log_text):
-                    mod_id = match.group(1).lower()
-                    if mod_id not in all_client_crashes:
-                        all_client_crashes.append(mod_id)
+                for match in patterns.from_mod.finditer(log_text):
+                    client_crashes.setdefault(sys.intern(match.group(1).lower()))
                 
                 break
         
+        all_client_crashes = list(client_crashes)
         if all_client_crashes:
+            # One pass collects every jar the log mentions; each culprit is then a substring lookup
+            mod_jars = patterns.mods_jar.findall(log_lower)
             bad_files = []
             for culprit_mod in all_client_crashes:
-                jar_pattern = rf"mods/([^\s/]*{re.escape(culprit_mod)}[^\s/]*\.jar)"
-                jar_match = re.search(jar_pattern, log_lower)
-                if jar_match:
-                    bad_files.append(jar_match.group(1))
+                jar = _find_mod_jar(mod_jars, culprit_mod)
+                if jar:
+                    bad_files.append(jar)
             
             return {
                 "type": "mod_error",
@@ -371,20 +516,12 @@ class NeoForgeLoader(LoaderBase):
                 "bad_files": bad_files
             }
         
-        missing_patterns = [
-            (r"mod\s+(" + MOD_ID + r")\s+requires?\s+(" + MOD_ID + r")", 1, 2),
-            (r"failure\s+message:\s+mod\s+(" + MOD_ID + r")\s+requires?\s+(" + MOD_ID + r")", 1, 2),
-            (r"missing\s+(?:or\s+unsupported\s+)?(?:mandatory\s+)?dependenc(?:y|ies)[:\s]+(" + MOD_ID + r")", None, 1),
-            (r"could\s+not\s+find\s+(?:required\s+mod[:\s]+)?(" + MOD_ID + r")", None, 1),
-            (r"missing\s+dependency[:\s]+(" + MOD_ID + r")", None, 1),
-            (r"mod\s+file\s+\S+\s+needs\s+(" + MOD_ID + r")", None, 1),
-        ]
-        
-        for pattern, culprit_group, dep_group in missing_patterns:
-            match = re.search(pattern, log_lower)
+        mentioned = any(kw in log_lower for kw in _CATEGORY_KEYWORDS["missing_dep"])
+        for pattern, culprit_group, dep_group in patterns.missing_dep if mentioned else ():
+            match = pattern.search(log_lower)
             if match:
-                dep_name = match.group(dep_group)
-                culprit = match.group(culprit_group) if culprit_group else None
+                dep_name = sys.intern(match.group(dep_group))
+                culprit = sys.intern(match.group(culprit_group)) if culprit_group else None
                 return {
                     "type": "missing_dep",
                     "dep": dep_name,
@@ -393,61 +530,19 @@ class NeoForgeLoader(LoaderBase):
                     "message": relevant_log[:1000]
                 }
         
-        def _extract_mod_id_from_mixin_path(path_or_id):
-            if not path_or_id:
-                return None
-            s = path_or_id.lower().strip()
-            if '.' not in s:
-                return s
-            parts = s.split('.')
-            skip_words = {'mixin', 'mixins', 'common', 'client', 'server', 'api', 'impl', 'core', 'internal', 'util', 'handler', 'access', 'wrapper', 'hook', 'patch', 'transform', 'chunk', 'world', 'entity', 'block', 'item', 'screen', 'container', 'packet', 'network', 'data', 'config'}
-            mixin_idx = -1
-            for i, part in enumerate(parts):
-                if 'mixin' in part:
-                    mixin_idx = i
-                    break
-            if mixin_idx > 0:
-                for i in range(mixin_idx - 1, -1, -1):
-                    part = parts[i]
-                    if part in skip_words or part in ('dev', 'com', 'org', 'net', 'io', 'me', 'xyz'):
-                        continue
-                    if len(part) >= 3:
-                        return part
-            for part in reversed(parts):
-                if part in skip_words:
-                    continue
-                if len(part) >= 3 and not part.startswith('class') and not part.startswith('mixin'):
-                    return part
-            return parts[-1] if parts else s
-        
-        benign_mixin_match = re.search(
-            r"overwrite\s+conflict\s+for\s+(\S+)\s+in\s+(\S+)\s+from\s+(?:mod\s+)?(" + MOD_ID + r")[\s,].*?"
-            r"previously\s+(?:written|defined)\s+by\s+(.+?)\.?\s+Skipping\s+method\.?",
-            log_text, re.IGNORECASE
-        )
-        if benign_mixin_match:
-            return {
-                "type": "benign_mixin_warning",
-                "conflict_type": "mixin_overwrite_handled",
-                "culprit": None,
-                "culprits": [],
-                "message": "Mixin overwrite warning (handled gracefully)"
-            }
-        
-        conflict_patterns = [
-            (r"duplicatemodsfoundexception.*?(\S+\.jar).*?(\S+\.jar)", "duplicate"),
-            (r"duplicate\s+(?:registry\s+)?(?:key|entry|id)[:\s]+(" + MOD_ID + r"[:/]" + MOD_ID + r")", "registry"),
-            (r"(" + MOD_ID + r"[:/]" + MOD_ID + r")\s+is\s+already\s+registered", "registry"),
-            (r"mixin\s+apply\s+for\s+mod\s+(" + MOD_ID + r")\s+failed", "mixin_fail"),
-            (r"mixinapplyerror.*?mod[:\s]+(" + MOD_ID + r")", "mixin_fail"),
-            (r"mixintransformererror.*?from\s+mod\s+(" + MOD_ID + r")", "mixin_error"),
-            (r"incompatible\s+mod(?:s)?\s+(?:set|found|detected)", "incompatible"),
-            (r"(" + MOD_ID + r")\s+conflicts?\s+with\s+(" + MOD_ID + r")", "conflict"),
-        ]
-        
-        for pattern, conflict_type in conflict_patterns:
-            match = re.search(pattern, log_lower)
+        mentioned = any(kw in log_lower for kw in _CATEGORY_KEYWORDS["conflict"])
+        for pattern, conflict_type in patterns.conflict if mentioned else ():
+            match = pattern.search(log_lower)
             if match:
+                if conflict_type == "benign_mixin":
+                    return {
+                        "type": "benign_mixin_warning",
+                        "conflict_type": "mixin_overwrite_handled",
+                        "culprit": None,
+                        "culprits": [],
+                        "message": "Mixin overwrite warning (handled gracefully)"
+                    }
+                
                 culprits = [g for g in match.groups() if g]
                 if conflict_type == "registry" and culprits:
                     ns = culprits[0].split(":")[0] if ":" in culprits[0] else culprits[0].split("/")[0]
@@ -456,6 +551,8 @@ class NeoForgeLoader(LoaderBase):
                 if conflict_type in ("mixin_fail", "mixin_error"):
                     culprits = [_extract_mod_id_from_mixin_path(c) for c in culprits]
                 
+                culprits = [sys.intern(c) for c in culprits]
+                
                 primary_culprit = culprits[-1] if culprits else None
                 
                 return {
@@ -466,20 +563,12 @@ class NeoForgeLoader(LoaderBase):
                     "message": relevant_log[:1000]
                 }
         
-        mod_error_patterns = [
-            (r"error\s+loading\s+mod[:\s]+(" + MOD_ID + r")", 1),
-            (r"mod\s+(" + MOD_ID + r")\s+has\s+crashed", 1),
-            (r"exception\s+.*?mod[:\s]+(" + MOD_ID + r")", 1),
-            (r"caused\s+by\s+mod[:\s]+(" + MOD_ID + r")", 1),
-            (r"modloadingexception.*?(" + MOD_ID + r")", 1),
-            (r"mod\s+\S+\s+\((" + MOD_ID + r")\)\s+encountered\s+an?\s+error", 1),
-        ]
-        
-        for pattern, group in mod_error_patterns:
-            match = re.search(pattern, log_lower)
+        mentioned = any(kw in log_lower for kw in _CATEGORY_KEYWORDS["mod_error"])
+        for pattern, group in patterns.mod_error if mentioned else ():
+            match = pattern.search(log_lower)
             if match:
-                culprit = match.group(group)
-                if culprit not in ("minecraft", "neoforge", "fml", "forge", "java", "net"):
+                culprit = sys.intern(match.group(group))
+                if culprit not in _NOT_A_CULPRIT:
                     return {
                         "type": "mod_error",
                         "culprit": culprit,
@@ -488,14 +577,12 @@ class NeoForgeLoader(LoaderBase):
                     }
         
         if "exception" in log_lower or "error" in log_lower or "crash" in log_lower:
-            stack_mods = re.findall(r"at\s+(?:com|net|dev|io|org)\.([\w]+)\.([\w]+)\.", log_lower)
-            framework_pkgs = {"mojang", "minecraft", "neoforged", "neoforge", "cpw", "fml",
-                              "google", "gson", "apache", "netty", "oshi", "slf4j", "log4j",
-                              "java", "sun", "jdk", "spongepowered", "mixin"}
-            mod_pkgs = [(a, m) for a, m in stack_mods if a not in framework_pkgs and m not in framework_pkgs]
-            
-            if mod_pkgs:
-                author, modname = mod_pkgs[0]
+            # Only the first non-framework frame matters; stop scanning there
+            for frame in patterns.stack_frame.finditer(log_lower):
+                author, modname = frame.groups()
+                if author in _FRAMEWORK_PKGS or modname in _FRAMEWORK_PKGS:
+                    continue
+                modname = sys.intern(modname)
                 return {
                     "type": "mod_error",
                     "culprit": modname,
@@ -3,8 +3,64 @@ import requests
 import json
 import os
 import subprocess
+import threading
+import time
+from collections import deque
 from typing import List, Dict, Optional
 from pathlib import Path
+from urllib.parse import urlparse
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    _json_loads = json.loads
+
+TQDM_AVAILABLE = False
+try:
+    from tqdm import tqdm
+    TQDM_AVAILABLE = True
+except ImportError:
+    pass
+
+IJSON_AVAILABLE = False
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    pass
+
+
+# Requests allowed per minute, keyed by API host
+HOST_RATE_LIMITS = {
+    "api.modrinth.com": 300,
+    "api.curseforge.com": 60,
+}
+DEFAULT_RATE_LIMIT = 60
+MAX_RETRIES = 4
+
+
+class _RateLimiter:
+    """Sliding-window limiter: at most max_calls entries per period seconds"""
+    def __init__(self, max_calls: int, period: float = 60.0):
+        self.max_calls = max_calls
+        self.period = period
+        self.calls = deque()
+        self.lock = threading.Lock()
+    
+    def __enter__(self):
+        with self.lock:
+            now = time.monotonic()
+            while self.calls and now - self.calls[0] >= self.period:
+                self.calls.popleft()
+            if len(self.calls) >= self.max_calls:
+                time.sleep(self.period - (now - self.calls[0]))
+                self.calls.popleft()
+            self.calls.append(time.monotonic())
+        return self
+    
+    def __exit__(self, *exc):
+        return False
 
 
 class ModInfo:
@@ -41,8 +97,53 @@ class ModManager:
         self.cache_file = os.path.join(self.cwd, ".mod_cache.json")
         self.mod_inventory = os.path.join(self.cwd, ".mod_inventory.json")
         
+        self._limiters: Dict[str, _RateLimiter] = {}
+        self._cf_api_key = self._load_cf_key()
+        
         os.makedirs(self.mods_dir, exist_ok=True)
     
+    def _load_cf_key(self) -> Optional[str]:
+        """Read the CurseForge API key once, if present"""
+        key_file = Path(self.cwd) / "curseforgeAPIkey"
+        return key_file.read_text().strip() if key_file.exists() else None
+    
+    def _limiter(self, host: str) -> _RateLimiter:
+        """Get the rate limiter for an API host"""
+        if host not in self._limiters:
+            self._limiters[host] = _RateLimiter(HOST_RATE_LIMITS.get(host, DEFAULT_RATE_LIMIT))
+        return self._limiters[host]
+    
+    def _get(self, url: str, **kwargs) -> requests.Response:
+        """GET with per-host rate limiting, honoring Retry-After on 429 and backing off on 503"""
+        limiter = self._limiter(urlparse(url).netloc)
+        backoff = 0.5
+        for attempt in range(MAX_RETRIES + 1):
+            with limiter:
+                r = requests.get(url, **kwargs)
+            if r.status_code not in (429, 503) or attempt == MAX_RETRIES:
+                return r
+            r.close()
+            retry_after = r.headers.get("Retry-After")
+            try:
+                delay = float(retry_after) if retry_after else backoff
+            except ValueError:
+                delay = backoff
+            time.sleep(delay)
+            backoff *= 2
+        return r
+    
+    @staticmethod
+    def _iter_json_items(r: requests.Response, key: str):
+        """Yield entries of the top-level list `key`, parsing while the body streams in when ijson is available"""
+        if IJSON_AVAILABLE:
+            r.raw.decode_content = True
+            try:
+                yield from ijson.items(r.raw, f"{key}.item")
+            finally:
+                r.close()
+        else:
+            yield from _json_loads(r.content).get(key, [])
+    
     def get_100_mods_modrinth(self) -> List[ModInfo]:
         """Fetch 100+ actual gameplay mods from Modrinth (no libraries/APIs)"""
         print(f"\n[MOD_MANAGER] Fetching 100 {self.loader} mods from Modrinth ({self.mc_version})...")
@@ -65,26 +166,23 @@ class ModManager:
         
         while len(mods) < 150 and offset < 2000:
             try:
-                r = requests.get(
+                r = self._get(
                     "https://api.modrinth.com/v2/search",
                     params={
                         "limit": 100,
                         "offset": offset,
                         "sort": "downloads:desc"
                     },
+                    stream=True,
                     timeout=10
                 )
                 
                 if r.status_code != 200:
                     break
                 
-                data = r.json()
-                hits = data.get("hits", [])
-                
-                if not hits:
-                    break
-                
-                for mod in hits:
+                hits = 0
+                for mod in self._iter_json_items(r, "hits"):
+                    hits += 1
                     slug = mod["slug"]
                     if slug in mods:
                         continue
@@ -115,14 +213,17 @@ class ModManager:
                         )
                         mods[slug] = mod_info
                 
+                if not hits:
+                    break
+                
                 offset += 100
                 
             except Exception as e:
                 print(f"  Error at offset {offset}: {e}")
                 break
         
-        # Sort by downloads (get from last request)
-        sorted_mods = sorted(mods.values(), key=lambda x: x.name)[:100]
+        # Results arrive sorted by downloads:desc and dicts keep insertion order
+        sorted_mods = list(mods.values())[:100]
         
         print(f"  Collected: {len(sorted_mods)} mods from Modrinth")
         return sorted_mods
@@ -140,13 +241,15 @@ class ModManager:
         }
         cf_loader = loader_map.get(self.loader)
         
-        headers = {}
+        headers = {"Accept": "application/json"}
+        if self._cf_api_key:
+            headers["x-api-key"] = self._cf_api_key
         mods = {}
         page = 1
         
         while len(mods) < 150 and page <= 10:
             try:
-                r = requests.get(
+                r = self._get(
                     "https://api.curseforge.com/v1/mods/search",
                     params={
                         "gameId": 432,
@@ -156,19 +259,16 @@ class ModManager:
                         "gameVersion": self.mc_version
                     },
                     headers=headers,
+                    stream=True,
                     timeout=10
                 )
                 
                 if r.status_code != 200:
                     break
                 
-                data = r.json()
-                results = data.get("data", [])
-                
-                if not results:
-                    break
-                
-                for mod in results:
+                results = 0
+                for mod in self._iter_json_items(r, "data"):
+                    results += 1
                     mod_id = mod["id"]
                     if mod_id in mods:
                         continue
@@ -189,6 +289,9 @@ class ModManager:
                     )
                     mods[mod_id] = mod_info
                 
+                if not results:
+                    break
+                
                 page += 1
                 
             except Exception as e:
@@ -199,24 +302,44 @@ class ModManager:
         print(f"  Collected: {len(sorted_mods)} mods from CurseForge")
         return sorted_mods
     
+    def get_100_mods(self) -> List[ModInfo]:
+        """Fetch mods from Modrinth and CurseForge, dropping cross-provider duplicates"""
+        return self.merge_mods(self.get_100_mods_modrinth(), self.get_100_mods_curseforge())
+    
+    @staticmethod
+    def _canon(name: str) -> str:
+        """Normalize a mod name so the same mod matches across providers"""
+        return "".join(c for c in name.lower() if c.isalnum())
+    
+    def merge_mods(self, *mod_lists: List[ModInfo]) -> List[ModInfo]:
+        """Merge provider results, keeping the first mod seen per (name, loader, mc_version)"""
+        merged = {}
+        for mod_list in mod_lists:
+            for mod in mod_list:
+                key = (self._canon(mod.name or mod.slug), mod.loader, mod.mc_version)
+                merged.setdefault(key, mod)
+        return list(merged.values())
+    
     def fetch_dependencies(self, mod_list: List[ModInfo]) -> Dict[str, List[str]]:
         """Fetch dependencies for each mod from Modrinth API"""
         print(f"\n[MOD_MANAGER] Fetching dependencies for {len(mod_list)} mods...")
         
         deps = {}
         
-        for i, mod in enumerate(mod_list):
+        progress = tqdm(mod_list, desc="deps", unit="mod") if TQDM_AVAILABLE else mod_list
+        
+        for i, mod in enumerate(progress):
             if mod.source != "modrinth":
                 continue  # CurseForge deps require different API
             
             try:
-                r = requests.get(
+                r = self._get(
                     f"https://api.modrinth.com/v2/project/{mod.slug}",
                     timeout=10
                 )
                 
                 if r.status_code == 200:
-                    details = r.json()
+                    details = _json_loads(r.content)
                     mod_deps = []
                     
                     for dep_rel in details.get("dependencies", []):
@@ -228,7 +351,8 @@ class ModManager:
                     deps[mod.slug] = mod_deps
                     mod.deps = mod_deps
                 
-                if (i + 1) % 25 == 0:
+                # Without tqdm, fall back to a plain progress line
+                if not TQDM_AVAILABLE and (i + 1) % 25 == 0:
                     print(f"  Processed: {i + 1}/{len(mod_list)}")
                     
             except Exception as e:
@@ -237,6 +361,15 @@ class ModManager:
         print(f"  Dependencies fetched: {sum(len(d) for d in deps.values())} total")
         return deps
     
+    def install_popular_mods(self, resolve_deps: bool = True) -> Dict[str, any]:
+        """Install the most popular mods from Modrinth and CurseForge, each mod only once"""
+        mods = self.get_100_mods()
+        if resolve_deps:
+            self.fetch_dependencies(mods)
+        result = self.install_mods([m.slug for m in mods], resolve_deps=resolve_deps)
+        self.save_inventory(mods)
+        return result
+    
     def install_mods(self, mod_slugs: List[str], resolve_deps: bool = True) -> Dict[str, any]:
         """Install mods via ferium with dependency resolution"""
         print(f"\n[MOD_MANAGER] Installing {len(mod_slugs)} mods ({self.loader}, {self.mc_version})...")
@@ -295,23 +428,50 @@ class ModManager:
         
         # Download
         print(f"\n[MOD_MANAGER] Downloading {added} mods...")
-        result = subprocess.run(
-            [self.ferium_bin, "download"],
-            capture_output=True,
-            text=True,
-            timeout=600
-        )
+        returncode = self._stream_ferium_download(timeout=600)
         
         # Count downloads
-        downloaded = len([f for f in os.listdir(self.mods_dir) if f.endswith('.jar')])
+        with os.scandir(self.mods_dir) as it:
+            downloaded = sum(1 for e in it if e.is_file() and e.name.endswith('.jar'))
         
         return {
-            "status": "success" if result.returncode == 0 else "partial",
+            "status": "success" if returncode == 0 else "partial",
             "added": added,
             "downloaded": downloaded,
             "failed": failed
         }
     
+    def _stream_ferium_download(self, timeout: float = 600) -> int:
+        """Run `ferium download`, echoing progress lines as they arrive"""
+        proc = subprocess.Popen(
+            [self.ferium_bin, "download"],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1
+        )
+        # Reading stdout blocks, so enforce the timeout by killing the child
+        timed_out = threading.Event()
+        
+        def _kill():
+            timed_out.set()
+            proc.kill()
+        
+        timer = threading.Timer(timeout, _kill)
+        timer.start()
+        try:
+            for line in proc.stdout:
+                if "downloaded" in line.lower():
+                    print(f"  {line.strip()}")
+            returncode = proc.wait()
+        finally:
+            timer.cancel()
+            proc.stdout.close()
+        
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(proc.args, timeout)
+        return returncode
+    
     def _ferium_loader_name(self) -> str:
         """Convert loader name to ferium format, why bother except for neo-forge?"""
         return {
@@ -322,9 +482,14 @@ class ModManager:
     
     def check_mod_exists(self, mod_slug: str) -> bool:
         """Check if exact version of mod already exists"""
-        for f in os.listdir(self.mods_dir):
-            if mod_slug in f.lower() and self.mc_version in f and self.loader in f.lower():
-                return True
+        mc = self.mc_version
+        ldr = self.loader.lower()
+        slug = mod_slug.lower()
+        with os.scandir(self.mods_dir) as it:
+            for e in it:
+                fl = e.name.lower()
+                if slug in fl and mc in e.name and ldr in fl:
+                    return True
         return False
     
     def save_inventory(self, mods: List[ModInfo]):
@@ -345,9 +510,9 @@ class ModManager:
         params = {"query": keyword, "game_versions": f"[{self.mc_version}]", "facets": '[["project_type:mod"]]', "limit": limit}
         
         try:
-            resp = requests.get(url, params=params, timeout=30)
+            resp = self._get(url, params=params, timeout=30)
             resp.raise_for_status()
-            data = resp.json()
+            data = _json_loads(resp.content)
             
             mods = []
             for hit in data.get("hits", []):
@@ -378,14 +543,14 @@ class ModManager:
                 version_url = f"https://api.modrinth.com/v2/project/{slug}/version"
                 params = {"game_versions": [self.mc_version], "loaders": [self.loader]}
                 
-                resp = requests.get(version_url, params=params, timeout=30)
-                versions = resp.json()
+                resp = self._get(version_url, params=params, timeout=30)
+                versions = _json_loads(resp.content)
                 
                 if versions:
                     for f in versions[0].get("files", []):
                         if f.get("primary"):
                             jar_path = os.path.join(self.mods_dir, f["filename"])
-                            resp = requests.get(f["url"], timeout=60)
+                            resp = self._get(f["url"], timeout=60)
                             with open(jar_path, 'wb') as pf:
                                 pf.write(resp.content)
                             installed.append(slug)
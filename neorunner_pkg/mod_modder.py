@@ -110,19 +110,75 @@ BEST PRACTICES FOR MODPACK AUTHORS:
 
 ================================================================================
 """
+import functools
+import io
 import os
 import json
 import subprocess
 import re
 import zipfile
+import zlib
 import tempfile
 import shutil
+import sys
 import logging
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Set, Tuple, Optional
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Load-order prefixes added by this module (!aa_00_, !zz_03_, 01_, ...)
+_PREFIX_RE = re.compile(r'^(!?[a-z]{2}_\d{2}_|!|\d{2}_)', re.IGNORECASE)
+# Mixin config references inside mods.toml / fabric.mod.json
+_MIXIN_REF_RE = re.compile(r'mixin[s]?["\']?\s*[:=]\s*["\']?([^\s"\',}]+)', re.IGNORECASE)
+# Cheap pre-filter so metadata without any mixin mention is never decoded
+_MIXIN_BYTES_RE = re.compile(rb'mixin', re.IGNORECASE)
+_MOD_METADATA_SUFFIXES = ('mods.toml', 'fabric.mod.json')
+# Failures reading or parsing a single JAR entry; JSON and Unicode errors are ValueErrors
+_ENTRY_ERRORS = (ValueError, KeyError, TypeError, zipfile.BadZipFile, zlib.error, OSError)
+# Filename keywords (matched against lowercased names) for mixin priority scoring
+_API_KW_RE = re.compile(r'library|api|core|lib')
+_COMPAT_KW_RE = re.compile(r'compat|patch|fix')
+_ADDON_KW_RE = re.compile(r'optional|addon|plugin')
+# Filename keywords for optimize_load_order's first/last buckets
+_LOAD_FIRST_KW_RE = re.compile(r'library|api|core|lib|bukkit|spigot')
+_LOAD_LAST_KW_RE = re.compile(r'addon|plugin|optional|compat')
+
+# Load-order categories for optimize_load_order, in the order they load
+_API, _REGULAR, _ADDON = range(3)
+_LOAD_ORDER_CATEGORIES = (("aa", "api"), ("bb", "regular"), ("zz", "addon"))
+
+
+@functools.lru_cache(maxsize=4096)
+def _strip_prefix(filename: str) -> str:
+    """Remove a load-order prefix from a mod filename"""
+    return _PREFIX_RE.sub('', filename)
+
+
+def _loader_from_names(names: List[str]) -> Optional[str]:
+    """Detect the mod loader from a JAR's entry names"""
+    has_quilt = has_toml = False
+    for n in names:
+        if 'fabric.mod.json' in n:
+            return "fabric"
+        if 'quilt.mod.json' in n:
+            has_quilt = True
+        elif 'mods.toml' in n:
+            has_toml = True
+    if has_quilt:
+        return "quilt"
+    if has_toml:
+        return "forge"
+    return None
+
+
 class MixinConflictResolver:
     """Detects and resolves mixin conflicts between mods"""
     
@@ -131,48 +187,82 @@ class MixinConflictResolver:
         self.mc_version = mc_version
         self.conflicts: List[Dict] = []
         self.mixin_targets: Dict[str, List[str]] = {}
-        
+        # (unprefixed name, mtime_ns, size) -> scan result, so renamed-but-unchanged JARs are not rescanned
+        self._scan_cache: Optional[Dict[Tuple[str, int, int], Dict]] = None
+        self._scan_cache_file = os.path.join(os.path.dirname(os.path.abspath(mods_dir)), ".mixinresolver_cache.json")
+        
+    def _load_scan_cache(self) -> Dict[Tuple[str, int, int], Dict]:
+        """Load persisted scan results from a previous run"""
+        if self._scan_cache is None:
+            self._scan_cache = {}
+            try:
+                with open(self._scan_cache_file) as f:
+                    for clean, mtime_ns, size, data in json.load(f):
+                        self._scan_cache[(clean, mtime_ns, size)] = data
+            except (OSError, ValueError, TypeError):
+                pass
+        return self._scan_cache
+    
+    def _save_scan_cache(self):
+        """Persist scan results for the next run"""
+        try:
+            with open(self._scan_cache_file, 'w') as f:
+                json.dump([[*key, data] for key, data in self._scan_cache.items()], f)
+        except OSError as e:
+            logger.debug(f"Could not write scan cache: {e}")
+    
     def scan_mod_mixins(self, jar_path: str) -> Dict:
         """Scan a single mod JAR for mixin definitions"""
         result = {
             "mod": os.path.basename(jar_path),
             "mixin_configs": [],
             "targets": [],
-            "package": None
+            "package": None,
+            "loader": None
         }
         
+        # Insertion-ordered set: drops duplicates but keeps conflict order deterministic
+        targets: Dict[str, None] = {}
+        
         try:
             with zipfile.ZipFile(jar_path, 'r') as zf:
-                for name in zf.namelist():
+                names = zf.namelist()
+                result["loader"] = _loader_from_names(names)
+                for name in names:
+                    # Only .json entries pay for the lowercase copy
                     if name.endswith('.json') and 'mixin' in name.lower():
                         try:
-                            content = zf.read(name).decode('utf-8')
-                            config = json.loads(content)
+                            if orjson is not None:
+                                config = orjson.loads(zf.read(name))
+                            else:
+                                with zf.open(name) as fh:
+                                    config = json.load(io.TextIOWrapper(fh, encoding='utf-8'))
                             result["mixin_configs"].append(name)
                             
                             if isinstance(config, dict):
                                 if "package" in config:
                                     result["package"] = config["package"]
-                                targets = config.get("targets", [])
-                                if isinstance(targets, list):
-                                    result["targets"].extend(targets)
+                                config_targets = config.get("targets", [])
+                                if isinstance(config_targets, list):
+                                    targets.update(dict.fromkeys(sys.intern(t) for t in config_targets if isinstance(t, str)))
                                 for pkg in config.get("mixins", []):
-                                    if pkg:
-                                        result["targets"].append(pkg)
-                        except:
+                                    if pkg and isinstance(pkg, str):
+                                        targets[sys.intern(pkg)] = None
+                        except _ENTRY_ERRORS:
                             pass
                     
-                    if name.endswith('mods.toml') or name.endswith('fabric.mod.json'):
+                    if name.endswith(_MOD_METADATA_SUFFIXES):
                         try:
-                            content = zf.read(name).decode('utf-8')
-                            if 'mixin' in content.lower():
-                                mixin_refs = re.findall(r'mixin[s]?["\']?\s*[:=]\s*["\']?([^\s"\',}]+)', content, re.IGNORECASE)
-                                result["targets"].extend(mixin_refs)
-                        except:
+                            raw = zf.read(name)
+                            if _MIXIN_BYTES_RE.search(raw):
+                                mixin_refs = _MIXIN_REF_RE.findall(raw.decode('utf-8'))
+                                targets.update(dict.fromkeys(map(sys.intern, mixin_refs)))
+                        except _ENTRY_ERRORS:
                             pass
-        except Exception as e:
-            pass
+        except (zipfile.BadZipFile, OSError) as e:
+            logger.warning(f"Could not scan {result['mod']}: {e}")
         
+        result["targets"] = list(targets)
         return result
     
     def scan_all_mods(self) -> Dict[str, Dict]:
@@ -182,23 +272,44 @@ class MixinConflictResolver:
         if not os.path.isdir(self.mods_dir):
             return mods_data
         
-        for filename in os.listdir(self.mods_dir):
-            if filename.endswith('.jar'):
-                jar_path = os.path.join(self.mods_dir, filename)
-                mods_data[filename] = self.scan_mod_mixins(jar_path)
+        cache = self._load_scan_cache()
+        jars = []
+        with os.scandir(self.mods_dir) as it:
+            for e in it:
+                if e.is_file() and e.name.endswith('.jar'):
+                    st = e.stat()
+                    jars.append((e.name, e.path, (_strip_prefix(e.name), st.st_mtime_ns, st.st_size)))
+        
+        to_scan = [(name, path, key) for name, path, key in jars if key not in cache]
+        if to_scan:
+            # JAR reads and zlib inflation release the GIL, so threads overlap the I/O
+            workers = min(16, (os.cpu_count() or 1) * 2, len(to_scan))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = pool.map(self.scan_mod_mixins, [path for _, path, _ in to_scan])
+                for (_, _, key), data in zip(to_scan, results):
+                    cache[key] = data
+        
+        for name, _, key in jars:
+            data = cache[key]
+            if data["mod"] != name:
+                data = {**data, "mod": name}
+            mods_data[name] = data
+        
+        if to_scan or len(cache) != len(jars):
+            live = {key for _, _, key in jars}
+            self._scan_cache = {key: cache[key] for key in live}
+            self._save_scan_cache()
         
         return mods_data
     
     def detect_conflicts(self, mods_data: Dict[str, Dict]) -> List[Dict]:
         """Detect potential mixin conflicts between mods"""
         conflicts = []
-        target_to_mods: Dict[str, List[str]] = {}
+        target_to_mods: Dict[str, List[str]] = defaultdict(list)
         
         for mod_name, data in mods_data.items():
             for target in data.get("targets", []):
-                if target not in target_to_mods:
-                    target_to_mods[target] = []
-                target_to_mods[target].append(mod_name)
+                target_to_mods[sys.intern(target)].append(mod_name)
         
         for target, mods in target_to_mods.items():
             if len(mods) > 1:
@@ -210,7 +321,7 @@ class MixinConflictResolver:
                 })
         
         self.conflicts = conflicts
-        self.mixin_targets = target_to_mods
+        self.mixin_targets = dict(target_to_mods)
         return conflicts
     
     def resolve_by_load_order(self) -> Dict:
@@ -221,6 +332,10 @@ class MixinConflictResolver:
             logger.info("No conflicts to resolve")
             return results
         
+        mods_prefix = os.path.join(self.mods_dir, "")
+        # Snapshot of the directory, kept current as files are renamed
+        existing = {e.name for e in os.scandir(self.mods_dir)}
+        
         for conflict in self.conflicts:
             if conflict["type"] == "shared_target":
                 mods = conflict["mods"]
@@ -233,10 +348,9 @@ class MixinConflictResolver:
                 logger.info(f"Resolving conflict for target {conflict['target']}: priority mod is {priority_mod}")
                 
                 for i, mod in enumerate(mods):
-                    old_path = os.path.join(self.mods_dir, mod)
+                    old_path = mods_prefix + mod
                     
-                    prefix_pattern = re.compile(r'^(!?[a-z]{2}_\d{2}_|!|\d{2}_)', re.IGNORECASE)
-                    clean_name = prefix_pattern.sub('', mod)
+                    clean_name = _strip_prefix(mod)
                     
                     if mod == priority_mod:
                         new_name = f"!aa_{i:02d}_{clean_name}"
@@ -248,11 +362,24 @@ class MixinConflictResolver:
                         logger.debug(f"Skipping {mod} - already has correct prefix")
                         continue
                     
-                    new_path = os.path.join(self.mods_dir, new_name)
+                    if mod not in existing:
+                        results["skipped"].append(mod)
+                        logger.debug(f"Skipping {mod} - already renamed by an earlier conflict")
+                        continue
+                    
+                    if new_name in existing:
+                        err_msg = f"Failed to rename {mod}: {new_name} already exists"
+                        logger.error(err_msg)
+                        results["errors"].append(err_msg)
+                        continue
+                    
+                    new_path = mods_prefix + new_name
                     
                     try:
                         logger.info(f"Renaming {mod} -> {new_name}")
                         os.rename(old_path, new_path)
+                        existing.discard(mod)
+                        existing.add(new_name)
                         results["renamed"].append({"old": mod, "new": new_name, "is_priority": mod == priority_mod})
                         results["resolved"] += 1
                     except OSError as e:
@@ -272,11 +399,11 @@ class MixinConflictResolver:
             score = 0
             mod_lower = mod.lower()
             
-            if any(x in mod_lower for x in ["library", "api", "core", "lib"]):
+            if _API_KW_RE.search(mod_lower):
                 score += 10
-            if any(x in mod_lower for x in ["compat", "patch", "fix"]):
+            if _COMPAT_KW_RE.search(mod_lower):
                 score += 5
-            if any(x in mod_lower for x in ["optional", "addon", "plugin"]):
+            if _ADDON_KW_RE.search(mod_lower):
                 score -= 5
             
             if score > highest_score:
@@ -295,10 +422,13 @@ class ModModder:
         self.mods_dir = mods_dir
         self.mc_version = mc_version
         self.resolver = MixinConflictResolver(mods_dir, mc_version)
+        # Last scan_all_mods result, kept so optimize_load_order need not reopen JARs
+        self._scanned: Optional[Dict[str, Dict]] = None
         
     def analyze_and_resolve(self) -> Dict:
         """Full analysis and conflict resolution workflow"""
         mods_data = self.resolver.scan_all_mods()
+        self._scanned = mods_data
         
         if not mods_data:
             return {
@@ -321,6 +451,7 @@ class ModModder:
             }
         
         resolution = self.resolver.resolve_by_load_order()
+        self._track_renames(resolution["renamed"])
         
         return {
             "status": "success",
@@ -336,34 +467,120 @@ class ModModder:
         if not os.path.isdir(self.mods_dir):
             return []
         
-        mods = [f for f in os.listdir(self.mods_dir) if f.endswith('.jar')]
+        with os.scandir(self.mods_dir) as it:
+            mods = [e.name for e in it if e.is_file() and e.name.endswith('.jar')]
         return sorted(mods)
     
+    def _track_renames(self, renamed: List[Dict]):
+        """Re-key the cached scan after renames so it keeps matching the directory"""
+        if not self._scanned or not renamed:
+            return
+        new_names = {r["old"]: r["new"] for r in renamed}
+        scanned = {}
+        for name, data in self._scanned.items():
+            if name in new_names:
+                name = new_names[name]
+                data = {**data, "mod": name}
+            scanned[name] = data
+        self._scanned = scanned
+    
     def _strip_prefix(self, filename: str) -> str:
-        prefix_pattern = re.compile(r'^(!?[a-z]{2}_\d{2}_|!|\d{2}_)', re.IGNORECASE)
-        return prefix_pattern.sub('', filename)
+        return _strip_prefix(filename)
     
     def _get_loader_type(self) -> str:
         """Detect mod loader type based on mods directory contents"""
+        if self._scanned:
+            for data in self._scanned.values():
+                if data.get("loader"):
+                    return data["loader"]
+            return "unknown"
+        
         try:
-            for f in os.listdir(self.mods_dir):
-                if f.endswith('.jar'):
-                    jar_path = os.path.join(self.mods_dir, f)
+            with os.scandir(self.mods_dir) as it:
+                for entry in it:
+                    if not (entry.is_file() and entry.name.endswith('.jar')):
+                        continue
                     try:
-                        with zipfile.ZipFile(jar_path, 'r') as zf:
-                            names = zf.namelist()
-                            if any('fabric.mod.json' in n for n in names):
+                        with zipfile.ZipFile(entry.path, 'r') as zf:
+                            # Metadata lives at fixed paths, so use the name index directly
+                            entries = zf.NameToInfo
+                            if 'fabric.mod.json' in entries:
                                 return "fabric"
-                            if any('quilt.mod.json' in n for n in names):
+                            if 'quilt.mod.json' in entries:
                                 return "quilt"
-                            if any('mods.toml' in n for n in names):
+                            if 'META-INF/mods.toml' in entries or 'META-INF/neoforge.mods.toml' in entries:
                                 return "forge"
-                    except:
+                    except (zipfile.BadZipFile, OSError):
                         continue
         except Exception as e:
             logger.warning(f"Could not detect loader type: {e}")
         return "unknown"
     
+    def _apply_rename_plan(self, plan: List[Tuple[str, str, str]]) -> Tuple[List[Dict], List[str]]:
+        """
+        Apply a list of (old_name, new_name, category) renames.
+        
+        Writability and target collisions are checked before any file is
+        touched, which is what makes os.replace safe to use here: targets
+        that already exist and are not part of the plan are rejected. If a
+        target is currently held by another mod in the plan, every file is
+        first moved to a temporary name so nothing unmoved gets clobbered.
+        """
+        renamed = []
+        errors = []
+        
+        if not plan:
+            return renamed, errors
+        
+        if not os.access(self.mods_dir, os.W_OK):
+            err_msg = f"Mods directory is not writable: {self.mods_dir}"
+            logger.error(err_msg)
+            return renamed, [err_msg]
+        
+        existing = {e.name for e in os.scandir(self.mods_dir)}
+        sources = {old for old, _, _ in plan}
+        
+        valid = []
+        for old, new, label in plan:
+            if new in existing and new not in sources:
+                err_msg = f"Failed to rename {old}: {new} already exists"
+                logger.error(err_msg)
+                errors.append(err_msg)
+            else:
+                valid.append((old, new, label))
+        
+        # Joined once; the loops below just concatenate names onto it
+        mods_prefix = os.path.join(self.mods_dir, "")
+        _replace = os.replace
+        
+        staged = []
+        if any(new in sources for _, new, _ in valid):
+            for old, new, label in valid:
+                tmp = f".{old}.nrtmp"
+                try:
+                    _replace(mods_prefix + old, mods_prefix + tmp)
+                    staged.append((old, tmp, new, label))
+                except OSError as e:
+                    err_msg = f"Failed to rename {old}: {e}"
+                    logger.error(err_msg)
+                    errors.append(err_msg)
+        else:
+            staged = [(old, old, new, label) for old, new, label in valid]
+        
+        debug = logger.isEnabledFor(logging.DEBUG)
+        for old, src, new, label in staged:
+            try:
+                if debug:
+                    logger.debug(f"Renaming {label} mod: {old} -> {new}")
+                _replace(mods_prefix + src, mods_prefix + new)
+                renamed.append({"old": old, "new": new, "category": label})
+            except OSError as e:
+                err_msg = f"Failed to rename {old}: {e}"
+                logger.error(err_msg)
+                errors.append(err_msg)
+        
+        return renamed, errors
+    
     def optimize_load_order(self) -> Dict:
         """
         Optimize load order for all mods (APIs first, then regular mods, addons last).
@@ -381,7 +598,8 @@ class ModModder:
             logger.error(f"Mods directory not found: {self.mods_dir}")
             return {"status": "error", "message": "Mods directory not found"}
         
-        mods = [f for f in os.listdir(self.mods_dir) if f.endswith('.jar')]
+        with os.scandir(self.mods_dir) as it:
+            mods = [e.name for e in it if e.is_file() and e.name.endswith('.jar')]
         
         if not mods:
             logger.info("No mods found to optimize")
@@ -390,83 +608,45 @@ class ModModder:
         loader_type = self._get_loader_type()
         logger.info(f"Detected loader type: {loader_type}")
         
-        api_mods = []
-        regular_mods = []
-        addon_mods = []
+        # (category, clean lowercase name, original name, clean name) per mod
+        categorized = []
         
         for mod in mods:
             clean_name = self._strip_prefix(mod)
             mod_lower = clean_name.lower()
-            if any(x in mod_lower for x in ["library", "api", "core", "lib", "bukkit", "spigot"]):
-                api_mods.append(mod)
-            elif any(x in mod_lower for x in ["addon", "plugin", "optional", "compat"]):
-                addon_mods.append(mod)
+            if _LOAD_FIRST_KW_RE.search(mod_lower):
+                category = _API
+            elif _LOAD_LAST_KW_RE.search(mod_lower):
+                category = _ADDON
             else:
-                regular_mods.append(mod)
+                category = _REGULAR
+            categorized.append((category, mod_lower, mod, clean_name))
         
-        renamed = []
-        errors = []
+        categorized.sort()
+        counts = [0] * len(_LOAD_ORDER_CATEGORIES)
+        
+        plan = []
         skipped = []
         
-        for i, mod in enumerate(sorted(api_mods, key=lambda x: self._strip_prefix(x).lower())):
-            clean_name = self._strip_prefix(mod)
-            new_name = f"!aa_{i:02d}_{clean_name}"
-            old_path = os.path.join(self.mods_dir, mod)
-            new_path = os.path.join(self.mods_dir, new_name)
+        for category, _, mod, clean_name in categorized:
+            i = counts[category]
+            counts[category] += 1
+            prefix, label = _LOAD_ORDER_CATEGORIES[category]
+            new_name = f"!{prefix}_{i:02d}_{clean_name}"
             
             if mod == new_name:
                 skipped.append(mod)
-                logger.debug(f"Skipping {mod} - already has correct prefix")
                 continue
-            
-            try:
-                logger.info(f"Renaming API mod: {mod} -> {new_name}")
-                os.rename(old_path, new_path)
-                renamed.append({"old": mod, "new": new_name, "category": "api"})
-            except OSError as e:
-                err_msg = f"Failed to rename {mod}: {e}"
-                logger.error(err_msg)
-                errors.append(err_msg)
+            plan.append((mod, new_name, label))
         
-        for i, mod in enumerate(sorted(regular_mods, key=lambda x: self._strip_prefix(x).lower())):
-            clean_name = self._strip_prefix(mod)
-            new_name = f"!bb_{i:02d}_{clean_name}"
-            old_path = os.path.join(self.mods_dir, mod)
-            new_path = os.path.join(self.mods_dir, new_name)
-            
-            if mod == new_name:
-                skipped.append(mod)
-                logger.debug(f"Skipping {mod} - already has correct prefix")
-                continue
-            
-            try:
-                logger.info(f"Renaming regular mod: {mod} -> {new_name}")
-                os.rename(old_path, new_path)
-                renamed.append({"old": mod, "new": new_name, "category": "regular"})
-            except OSError as e:
-                err_msg = f"Failed to rename {mod}: {e}"
-                logger.error(err_msg)
-                errors.append(err_msg)
+        renamed, errors = self._apply_rename_plan(plan)
+        self._track_renames(renamed)
         
-        for i, mod in enumerate(sorted(addon_mods, key=lambda x: self._strip_prefix(x).lower())):
-            clean_name = self._strip_prefix(mod)
-            new_name = f"!zz_{i:02d}_{clean_name}"
-            old_path = os.path.join(self.mods_dir, mod)
-            new_path = os.path.join(self.mods_dir, new_name)
-            
-            if mod == new_name:
-                skipped.append(mod)
-                logger.debug(f"Skipping {mod} - already has correct prefix")
-                continue
-            
-            try:
-                logger.info(f"Renaming addon mod: {mod} -> {new_name}")
-                os.rename(old_path, new_path)
-                renamed.append({"old": mod, "new": new_name, "category": "addon"})
-            except OSError as e:
-                err_msg = f"Failed to rename {mod}: {e}"
-                logger.error(err_msg)
-                errors.append(err_msg)
+        if renamed:
+            per_label = {label: 0 for _, label in _LOAD_ORDER_CATEGORIES}
+            for r in renamed:
+                per_label[r["category"]] += 1
+            logger.info(f"Renamed {len(renamed)} mods: " + ", ".join(f"{n} {label}" for label, n in per_label.items()))
         
         status = "success" if not errors else "partial"
         message = f"Optimized load order: {len(renamed)} renamed, {len(skipped)} skipped"
@@ -487,9 +667,9 @@ class ModModder:
             "renamed": renamed,
             "errors": errors,
             "skipped": len(skipped),
-            "api_mods": len(api_mods),
-            "regular_mods": len(regular_mods),
-            "addon_mods": len(addon_mods),
+            "api_mods": counts[_API],
+            "regular_mods": counts[_REGULAR],
+            "addon_mods": counts[_ADDON],
             "loader_type": loader_type,
             "warning": f"Filename prefixes may not affect {loader_type} load order" if loader_type != "unknown" else None
         }
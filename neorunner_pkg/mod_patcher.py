@@ -2,10 +2,144 @@
 import os
 import json
 import zipfile
-import tempfile
 import shutil
 import re
-from typing import Dict, List, Optional
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Iterable, List, Optional, Tuple
+
+try:
+    import orjson
+    _json_loads = orjson.loads
+    
+    def _json_dumps(obj, indent: bool = False) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    _json_loads = json.loads
+    
+    def _json_dumps(obj, indent: bool = False) -> bytes:
+        return json.dumps(obj, indent=2 if indent else None).encode('utf-8')
+
+# Per-mod work is zip I/O and zlib, both of which release the GIL
+PATCH_WORKERS = min(32, (os.cpu_count() or 1) * 2)
+# Rewritten JARs are written through a large buffer rather than the default 8 KiB
+WRITE_BUFFER = 1 << 20
+
+# Case-insensitive name checks without building a lowercased copy of every entry name
+_MIXIN_RE = re.compile(r'mixin', re.I)
+_REFMAP_RE = re.compile(r'refmap', re.I)
+
+
+def _is_mixin(name: str, pos: int = 0) -> bool:
+    """True for a .json entry mentioning 'mixin' at or after pos"""
+    return name.endswith('.json') and _MIXIN_RE.search(name, pos) is not None
+
+
+def _is_refmap(name: str, pos: int = 0) -> bool:
+    """True for a .json entry mentioning 'refmap' at or after pos"""
+    return name.endswith('.json') and _REFMAP_RE.search(name, pos) is not None
+
+
+def _write_json_atomic(path: str, obj, indent: bool = False):
+    """Write obj as JSON through a temp file and os.replace, so readers never see a torn file"""
+    # A unique temp file per write: a dashboard and a CLI run may flush the same mods_dir at once
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path) or ".", prefix=".tmp_", suffix=".json")
+    try:
+        # mkstemp creates files 0600; keep the mode a plain open() would have given
+        try:
+            mode = os.stat(path).st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o644
+        os.fchmod(fd, mode)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_json_dumps(obj, indent=indent))
+        os.replace(tmp_path, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_path)
+        except FileNotFoundError:
+            pass
+        raise
+
+
+class _ConfigCache:
+    """On-disk cache of parsed mixin configs, invalidated by JAR mtime and size"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, list] = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+        try:
+            with open(path, 'rb') as f:
+                self.entries = _json_loads(f.read())
+        except (OSError, ValueError):
+            pass
+    
+    def get(self, jar_path: str, st: os.stat_result) -> Optional[List[Dict]]:
+        entry = self.entries.get(jar_path)
+        if entry and entry[0] == st.st_mtime_ns and entry[1] == st.st_size:
+            return entry[2]
+        return None
+    
+    def put(self, jar_path: str, st: os.stat_result, configs: List[Dict]):
+        with self._lock:
+            self.entries[jar_path] = [st.st_mtime_ns, st.st_size, configs]
+            self.dirty = True
+    
+    def flush(self, live: Optional[Iterable[str]] = None):
+        """Save the cache, first dropping entries for JARs not in live (when given)"""
+        with self._lock:
+            if live is not None:
+                live_paths = set(live)
+                # Renamed and upgraded JARs leave their old paths behind; don't keep them forever
+                stale = [path for path in self.entries if path not in live_paths]
+                for path in stale:
+                    del self.entries[path]
+                if stale:
+                    self.dirty = True
+            if not self.dirty:
+                return
+            try:
+                _write_json_atomic(self.path, self.entries)
+                self.dirty = False
+            except OSError:
+                pass
+
+
+class _PatchedIndex:
+    """Single index of already-patched JARs, replacing per-mod .patched marker files"""
+    
+    def __init__(self, path: str):
+        self.path = path
+        self.entries: Dict[str, List[str]] = {}
+        self.dirty = False
+        self._lock = threading.Lock()
+        try:
+            with open(path, 'rb') as f:
+                self.entries = _json_loads(f.read())
+        except (OSError, ValueError):
+            pass
+    
+    def __contains__(self, mod_name: str) -> bool:
+        return mod_name in self.entries
+    
+    def add(self, mod_name: str, patches: List[str]):
+        with self._lock:
+            self.entries[mod_name] = patches
+            self.dirty = True
+    
+    def flush(self):
+        if not self.dirty:
+            return
+        try:
+            with self._lock:
+                _write_json_atomic(self.path, self.entries, indent=True)
+                self.dirty = False
+        except OSError:
+            pass
+
 
 class ModPatcher:
     """Automated mod patching for mixin compatibility"""
@@ -14,34 +148,66 @@ class ModPatcher:
         self.mods_dir = mods_dir
         self.mc_version = mc_version
         self.patched_log: List[str] = []
+        self._log_lock = threading.Lock()
+        self._config_cache = _ConfigCache(os.path.join(mods_dir, ".mixin_cache.json"))
+        self._patched_index = _PatchedIndex(os.path.join(mods_dir, ".neorunner_patched.json"))
+    
+    def _list_jars(self) -> List[os.DirEntry]:
+        """JARs in mods_dir, from a single scandir"""
+        with os.scandir(self.mods_dir) as it:
+            return [e for e in it if e.name.endswith('.jar')]
         
     def scan_mixin_configs(self, jar_path: str) -> List[Dict]:
         """Extract mixin configuration data from a JAR"""
+        try:
+            st = os.stat(jar_path)
+        except OSError:
+            return []
+        
+        configs = self._config_cache.get(jar_path, st)
+        if configs is None:
+            configs = self._scan_mixin_configs(jar_path)
+            self._config_cache.put(jar_path, st, configs)
+        return configs
+    
+    def _scan_mixin_configs(self, jar_path: str) -> List[Dict]:
+        """Uncached scan behind scan_mixin_configs"""
         configs = []
         
         try:
             with zipfile.ZipFile(jar_path, 'r') as zf:
-                for name in zf.namelist():
-                    if name.endswith('.json') and 'mixin' in name.lower():
-                        try:
-                            content = zf.read(name).decode('utf-8')
-                            config = json.loads(content)
-                            configs.append({
-                                "file": name,
-                                "config": config,
-                                "package": config.get("package", ""),
-                                "targets": config.get("targets", []),
-                                "mixins": config.get("mixins", [])
-                            })
-                        except:
-                            pass
+                wanted = []
+                for info in zf.infolist():
+                    name = info.filename
+                    # Decide from the central directory alone; refmaps are never mixin configs
+                    if _is_mixin(name) and not _is_refmap(name) and not info.is_dir():
+                        wanted.append(info)
+                
+                # Read in on-disk order so the file is walked front to back
+                wanted.sort(key=lambda i: i.header_offset)
+                for info in wanted:
+                    try:
+                        config = _json_loads(zf.read(info))
+                        configs.append({
+                            "file": info.filename,
+                            "config": config,
+                            "package": config.get("package", ""),
+                            "targets": config.get("targets", []),
+                            "mixins": config.get("mixins", [])
+                        })
+                    except:
+                        pass
         except Exception as e:
             pass
         
         return configs
     
-    def detect_conflict_risk(self, mod_name: str) -> Dict:
-        """Analyze a mod for potential mixin conflict risks"""
+    def detect_conflict_risk(self, mod_name: str, quick: bool = False) -> Dict:
+        """Analyze a mod for potential mixin conflict risks
+        
+        With quick=True collection stops as soon as the mod is known to be high
+        risk, so the returned targets and mixins may be incomplete.
+        """
         jar_path = os.path.join(self.mods_dir, mod_name)
         
         if not os.path.exists(jar_path):
@@ -49,112 +215,130 @@ class ModPatcher:
         
         configs = self.scan_mixin_configs(jar_path)
         
+        targets = set()
+        mixins = {}  # ordered set
+        for cfg in configs:
+            targets.update(cfg.get("targets", ()))
+            mixins.update(dict.fromkeys(cfg.get("mixins", ())))
+            if quick and len(targets) > 5:
+                break
+        
         risks = {
             "mod": mod_name,
             "mixin_configs": len(configs),
-            "targets": [],
-            "mixins": [],
+            "targets": list(targets),
+            "mixins": list(mixins),
             "risk_level": "low"
         }
         
-        all_targets = []
-        for cfg in configs:
-            all_targets.extend(cfg.get("targets", []))
-            risks["mixins"].extend(cfg.get("mixins", []))
-        
-        risks["targets"] = list(set(all_targets))
-        
         if len(configs) > 3:
             risks["risk_level"] = "medium"
-        if len(risks["targets"]) > 5:
+        if len(targets) > 5:
             risks["risk_level"] = "high"
         
         return risks
     
     def patch_mixin_refmap(self, jar_path: str, output_path: str) -> bool:
         """Patch mixin refmap for compatibility"""
-        try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with zipfile.ZipFile(jar_path, 'r') as zf:
-                    zf.extractall(temp_dir)
-                
-                patched = False
-                
-                for root, dirs, files in os.walk(temp_dir):
-                    for f in files:
-                        if f.endswith('.json') and 'refmap' in f.lower():
-                            file_path = os.path.join(root, f)
-                            try:
-                                with open(file_path, 'r') as fh:
-                                    content = fh.read()
-                                
-                                if '"mappings":' not in content and '"data":' not in content:
-                                    patched_data = {
-                                        "mappings": {},
-                                        "data": {}
-                                    }
-                                    with open(file_path, 'w') as fh:
-                                        json.dump(patched_data, fh)
-                                    patched = True
-                            except:
-                                pass
-                
-                if patched:
-                    with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                        for root, dirs, files in os.walk(temp_dir):
-                            for f in files:
-                                file_path = os.path.join(root, f)
-                                arcname = os.path.relpath(file_path, temp_dir)
-                                zf.write(file_path, arcname)
-                
-                return patched
-        except Exception as e:
-            return False
+        return self._rewrite_jar(jar_path, output_path, self._refmap_replacements)
     
     def add_mixin_priority(self, jar_path: str, output_path: str, priority: int) -> bool:
         """Add mixin priority configuration"""
+        return self._rewrite_jar(jar_path, output_path,
+                                 lambda zf: self._priority_replacement(zf, {}, priority))
+    
+    def _refmap_replacements(self, zf: zipfile.ZipFile) -> Dict[str, bytes]:
+        """Stub out refmaps that carry neither mappings nor data"""
+        replacements: Dict[str, bytes] = {}
+        for info in zf.infolist():
+            name = info.filename
+            if _is_refmap(name, name.rfind('/') + 1):
+                try:
+                    # The key check works on raw bytes; no need to decode the whole refmap
+                    content = zf.read(info)
+                    if b'"mappings":' not in content and b'"data":' not in content:
+                        replacements[info.filename] = _json_dumps({"mappings": {}, "data": {}})
+                except:
+                    pass
+        return replacements
+    
+    def _priority_replacement(self, zf: zipfile.ZipFile, replacements: Dict[str, bytes], priority: int) -> Dict[str, bytes]:
+        """Give the first mixin config in the archive a priority, on top of any earlier replacements"""
+        for info in zf.infolist():
+            name = info.filename
+            if _is_mixin(name, name.rfind('/') + 1):
+                try:
+                    config = _json_loads(replacements.get(info.filename) or zf.read(info))
+                    if "priority" not in config:
+                        config["priority"] = priority
+                        return {info.filename: _json_dumps(config, indent=True)}
+                except:
+                    pass
+                break
+        return {}
+    
+    def _rewrite_jar(self, jar_path: str, output_path: str, collect) -> bool:
+        """Stream jar_path into output_path with the entries returned by collect(zf) replaced"""
         try:
-            with tempfile.TemporaryDirectory() as temp_dir:
-                with zipfile.ZipFile(jar_path, 'r') as zf:
-                    zf.extractall(temp_dir)
-                
-                mixin_config_path = None
-                for root, dirs, files in os.walk(temp_dir):
-                    for f in files:
-                        if f.endswith('.json') and 'mixin' in f.lower():
-                            mixin_config_path = os.path.join(root, f)
-                            break
-                    if mixin_config_path:
-                        break
-                
-                if mixin_config_path:
-                    try:
-                        with open(mixin_config_path, 'r') as fh:
-                            config = json.load(fh)
-                        
-                        if "priority" not in config:
-                            config["priority"] = priority
-                            
-                            with open(mixin_config_path, 'w') as fh:
-                                json.dump(config, fh, indent=2)
-                            
-                            with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
-                                for root, dirs, files in os.walk(temp_dir):
-                                    for f in files:
-                                        file_path = os.path.join(root, f)
-                                        arcname = os.path.relpath(file_path, temp_dir)
-                                        zf.write(file_path, arcname)
-                            
-                            return True
-                    except:
-                        pass
-                
-                return False
-        except Exception as e:
+            with zipfile.ZipFile(jar_path, 'r') as zf_in:
+                replacements = collect(zf_in)
+                if not replacements:
+                    return False
+                with open(output_path, 'wb', buffering=WRITE_BUFFER) as fh, \
+                        zipfile.ZipFile(fh, 'w', zipfile.ZIP_DEFLATED) as zf_out:
+                    self._apply_patches_in_memory(zf_in, zf_out, replacements)
+            return True
+        except Exception:
+            # A corrupt entry fails mid-rewrite with zlib.error, EOFError and the like, not just BadZipFile
+            if os.path.exists(output_path):
+                os.remove(output_path)
             return False
     
-    def auto_patch_mod(self, mod_name: str) -> Dict:
-        """Automatically patch a single mod for compatibility"""
+    def _collect_patches(self, zf: zipfile.ZipFile, priority: int) -> Tuple[Dict[str, bytes], List[str]]:
+        """Work out the patched contents of refmap and mixin config entries without extracting the JAR"""
+        patches_applied: List[str] = []
+        
+        replacements = self._refmap_replacements(zf)
+        if replacements:
+            patches_applied.append("refmap_patched")
+        
+        priority_patch = self._priority_replacement(zf, replacements, priority)
+        if priority_patch:
+            replacements.update(priority_patch)
+            patches_applied.append("priority_added")
+        
+        return replacements, patches_applied
+    
+    def _apply_patches_in_memory(self, zf_in: zipfile.ZipFile, zf_out: zipfile.ZipFile, replacements: Dict[str, bytes]):
+        """Copy every entry to zf_out, substituting patched contents where present"""
+        for info in zf_in.infolist():
+            data = replacements.get(info.filename)
+            if data is None:
+                # Untouched entries keep their ZipInfo, so STORED entries stay stored
+                zf_out.writestr(info, zf_in.read(info))
+            else:
+                patched = zipfile.ZipInfo(info.filename, info.date_time)
+                patched.external_attr = info.external_attr
+                patched.compress_type = zipfile.ZIP_DEFLATED
+                zf_out.writestr(patched, data)
+    
+    def patch_jar(self, jar_path: str, output_path: str, priority: int = 1000) -> List[str]:
+        """Apply the refmap and mixin-priority patches in one read/write pass, returning the patches applied"""
+        patches_applied: List[str] = []
+        
+        def collect(zf: zipfile.ZipFile) -> Dict[str, bytes]:
+            replacements, patches = self._collect_patches(zf, priority)
+            patches_applied.extend(patches)
+            return replacements
+        
+        return patches_applied if self._rewrite_jar(jar_path, output_path, collect) else []
+    
+    def auto_patch_mod(self, mod_name: str, flush: bool = True) -> Dict:
+        """Automatically patch a single mod for compatibility
+        
+        flush=False leaves saving the patched index to the caller, as auto_patch_all
+        does once for the whole pass.
+        """
         jar_path = os.path.join(self.mods_dir, mod_name)
         
         if not os.path.exists(jar_path):
@@ -163,28 +347,30 @@ class ModPatcher:
         backup_path = jar_path + ".backup"
         
         if not os.path.exists(backup_path):
-            shutil.copy2(jar_path, backup_path)
-        
-        temp_output = jar_path + ".patched"
-        
-        patches_applied = []
+            # A hardlink is safe: patches land via os.replace onto a new inode,
+            # so the backup keeps the original bytes. Copy when links aren't supported.
+            try:
+                os.link(jar_path, backup_path)
+            except OSError:
+                shutil.copy2(jar_path, backup_path)
         
-        if self.patch_mixin_refmap(jar_path, temp_output):
-            patches_applied.append("refmap_patched")
-            shutil.move(temp_output, jar_path)
+        temp_output = jar_path + ".tmp"
         
-        if self.add_mixin_priority(jar_path, temp_output, 1000):
-            patches_applied.append("priority_added")
-            shutil.move(temp_output, jar_path)
-        
-        if os.path.exists(temp_output):
-            os.remove(temp_output)
+        try:
+            patches_applied = self.patch_jar(jar_path, temp_output, 1000)
+            if patches_applied:
+                os.replace(temp_output, jar_path)
+        finally:
+            # Never leave a half-written JAR in the mods folder
+            if os.path.exists(temp_output):
+                os.remove(temp_output)
         
         if patches_applied:
-            self.patched_log.append(f"{mod_name}: {', '.join(patches_applied)}")
-            marker_path = os.path.join(self.mods_dir, f"{mod_name}.patched")
-            with open(marker_path, 'w') as f:
-                f.write(f"Patched: {', '.join(patches_applied)}")
+            with self._log_lock:
+                self.patched_log.append(f"{mod_name}: {', '.join(patches_applied)}")
+            self._patched_index.add(mod_name, patches_applied)
+            if flush:
+                self._patched_index.flush()
         
         return {
             "success": True,
@@ -193,7 +379,7 @@ class ModPatcher:
             "patched": len(patches_applied) > 0
         }
     
-    def auto_patch_all(self) -> Dict:
+    def auto_patch_all(self, entries: Optional[List[os.DirEntry]] = None) -> Dict:
         """Automatically patch all mods for compatibility"""
         if not os.path.isdir(self.mods_dir):
             return {"status": "error", "message": "Mods directory not found"}
@@ -206,26 +392,29 @@ class ModPatcher:
             "details": []
         }
         
-        for filename in os.listdir(self.mods_dir):
-            if not filename.endswith('.jar'):
-                continue
-            
-            marker_path = os.path.join(self.mods_dir, f"{filename}.patched")
-            if os.path.exists(marker_path):
-                results["skipped"] += 1
-                continue
-            
+        def patch_one(filename: str) -> Tuple[str, Optional[str]]:
+            if filename in self._patched_index:
+                return "skipped", None
             try:
-                patch_result = self.auto_patch_mod(filename)
-                if patch_result.get("patched"):
-                    results["patched"] += 1
-                    results["details"].append(f"Patched {filename}")
-                else:
-                    results["skipped"] += 1
+                if self.auto_patch_mod(filename, flush=False).get("patched"):
+                    return "patched", f"Patched {filename}"
+                return "skipped", None
             except Exception as e:
-                results["errors"] += 1
-                results["details"].append(f"Error patching {filename}: {str(e)}")
-        
+                return "errors", f"Error patching {filename}: {str(e)}"
+        
+        # Callers that just listed mods_dir pass their listing in rather than scanning it again
+        if entries is None:
+            entries = self._list_jars()
+        jars = [e.name for e in entries]
+        with ThreadPoolExecutor(max_workers=PATCH_WORKERS) as pool:
+            # map() yields in submission order, so details stay deterministic
+            for outcome, detail in pool.map(patch_one, jars):
+                results[outcome] += 1
+                if detail:
+                    results["details"].append(detail)
+        
+        self._patched_index.flush()
+        self._config_cache.flush(e.path for e in entries)
         return results
 
 
@@ -250,10 +439,11 @@ class ModCompatibilityManager:
         if not os.path.isdir(self.mods_dir):
             return {"status": "error", "message": "Mods directory not found"}
         
-        mods = [f for f in os.listdir(self.mods_dir) if f.endswith('.jar')]
-        results["mods_analyzed"] = len(mods)
+        # auto_patch_all below reuses this listing
+        entries = self.patcher._list_jars()
+        results["mods_analyzed"] = len(entries)
         
-        patch_results = self.patcher.auto_patch_all()
+        patch_results = self.patcher.auto_patch_all(entries)
         results["patched"] = patch_results.get("patched", 0)
         results["details"].extend(patch_results.get("details", []))
         
@@ -264,7 +454,8 @@ class ModCompatibilityManager:
         if not os.path.isdir(self.mods_dir):
             return {"status": "error", "message": "Mods directory not found"}
         
-        mods = [f for f in os.listdir(self.mods_dir) if f.endswith('.jar')]
+        entries = self.patcher._list_jars()
+        mods = [e.name for e in entries]
         
         analysis = {
             "status": "success",
@@ -274,13 +465,17 @@ class ModCompatibilityManager:
             "recommendations": []
         }
         
-        for mod in mods:
-            risk = self.patcher.detect_conflict_risk(mod)
+        with ThreadPoolExecutor(max_workers=PATCH_WORKERS) as pool:
+            risks = list(pool.map(lambda mod: self.patcher.detect_conflict_risk(mod, quick=True), mods))
+        
+        for mod, risk in zip(mods, risks):
             if risk.get("mixin_configs", 0) > 0:
                 analysis["mods_with_mixins"] += 1
             if risk.get("risk_level") == "high":
                 analysis["high_risk_mods"].append(mod)
         
+        self.patcher._config_cache.flush(e.path for e in entries)
+        
         if analysis["mods_with_mixins"] > 10:
             analysis["recommendations"].append("Consider reducing number of core mixin mods")
         
@@ -4,15 +4,25 @@ NBT Parser for reading Minecraft world data.
 
 from __future__ import annotations
 
+import gzip
 import struct
+import zlib
 from pathlib import Path
 from typing import Dict, Any, Optional, Union
 from io import BytesIO
 
+# Precompiled unpackers so the format strings aren't re-parsed on every read
+_U_BYTE = struct.Struct(">b").unpack
+_U_SHORT = struct.Struct(">h").unpack
+_U_USHORT = struct.Struct(">H").unpack
+_U_INT = struct.Struct(">i").unpack
+_U_LONG = struct.Struct(">q").unpack
+_U_FLOAT = struct.Struct(">f").unpack
+_U_DOUBLE = struct.Struct(">d").unpack
 
 def read_nbt_string(data: BytesIO) -> str:
     """Read a UTF-8 string from NBT data."""
-    length = struct.unpack(">H", data.read(2))[0]
+    length = _U_USHORT(data.read(2))[0]
     if length == 0:
         return ""
     return data.read(length).decode('utf-8')
@@ -20,32 +30,32 @@ def read_nbt_string(data: BytesIO) -> str:
 
 def read_nbt_int(data: BytesIO) -> int:
     """Read a 32-bit signed integer."""
-    return struct.unpack(">i", data.read(4))[0]
+    return _U_INT(data.read(4))[0]
 
 
 def read_nbt_byte(data: BytesIO) -> int:
     """Read a single signed byte."""
-    return struct.unpack(">b", data.read(1))[0]
+    return _U_BYTE(data.read(1))[0]
 
 
 def read_nbt_short(data: BytesIO) -> int:
     """Read a 16-bit signed short."""
-    return struct.unpack(">h", data.read(2))[0]
+    return _U_SHORT(data.read(2))[0]
 
 
 def read_nbt_long(data: BytesIO) -> int:
     """Read a 64-bit signed long."""
-    return struct.unpack(">q", data.read(8))[0]
+    return _U_LONG(data.read(8))[0]
 
 
 def read_nbt_float(data: BytesIO) -> float:
     """Read a 32-bit float."""
-    return struct.unpack(">f", data.read(4))[0]
+    return _U_FLOAT(data.read(4))[0]
 
 
 def read_nbt_double(data: BytesIO) -> float:
     """Read a 64-bit double."""
-    return struct.unpack(">d", data.read(8))[0]
+    return _U_DOUBLE(data.read(8))[0]
 
 
 def read_nbt_byte_array(data: BytesIO) -> bytes:
@@ -57,13 +67,25 @@ def read_nbt_byte_array(data: BytesIO) -> bytes:
 def read_nbt_int_array(data: BytesIO) -> list:
     """Read an int array."""
     length = read_nbt_int(data)
-    return [read_nbt_int(data) for _ in range(length)]
+    return _read_numeric_run(data, "i", length)
 
 
 def read_nbt_long_array(data: BytesIO) -> list:
     """Read a long array."""
     length = read_nbt_int(data)
-    return [read_nbt_long(data) for _ in range(length)]
+    return _read_numeric_run(data, "q", length)
+
+
+def _read_numeric_run(data: BytesIO, code: str, length: int) -> list:
+    """Read `length` fixed-size big-endian values with a single read and unpack."""
+    if length <= 0:
+        return []
+    fmt = struct.Struct(f">{length}{code}")
+    return list(fmt.unpack(data.read(fmt.size)))
+
+
+# Struct codes for list element types that can be unpacked in bulk
+_NUMERIC_LIST_CODES = {1: "b", 2: "h", 3: "i", 4: "q", 5: "f", 6: "d"}
 
 
 def read_nbt_list(data: BytesIO) -> list:
@@ -71,28 +93,16 @@ def read_nbt_list(data: BytesIO) -> list:
     tag_type = read_nbt_byte(data)
     length = read_nbt_int(data)
     
-    items = []
-    for _ in range(length):
-        if tag_type == 1:  # Byte
-            items.append(read_nbt_byte(data))
-        elif tag_type == 2:  # Short
-            items.append(read_nbt_short(data))
-        elif tag_type == 3:  # Int
-            items.append(read_nbt_int(data))
-        elif tag_type == 4:  # Long
-            items.append(read_nbt_long(data))
-        elif tag_type == 5:  # Float
-            items.append(read_nbt_float(data))
-        elif tag_type == 6:  # Double
-            items.append(read_nbt_double(data))
-        elif tag_type == 8:  # String
-            items.append(read_nbt_string(data))
-        elif tag_type == 10:  # Compound
-            items.append(read_nbt_compound(data))
-        else:
-            # Skip unknown types
-            pass
+    code = _NUMERIC_LIST_CODES.get(tag_type)
+    if code is not None:
+        return _read_numeric_run(data, code, length)
     
+    reader = _TAG_READERS.get(tag_type)
+    if reader is None:
+        # Skip unknown types
+        return []
+    
+    items = [reader(data) for _ in range(length)]
     return items
 
 
@@ -112,58 +122,142 @@ def read_nbt_compound(data: BytesIO, depth: int = 0) -> Dict[str, Any]:
             
             name = read_nbt_string(data)
             
-            if tag_type == 1:  # Byte
-                result[name] = read_nbt_byte(data)
-            elif tag_type == 2:  # Short
-                result[name] = read_nbt_short(data)
-            elif tag_type == 3:  # Int
-                result[name] = read_nbt_int(data)
-            elif tag_type == 4:  # Long
-                result[name] = read_nbt_long(data)
-            elif tag_type == 5:  # Float
-                result[name] = read_nbt_float(data)
-            elif tag_type == 6:  # Double
-                result[name] = read_nbt_double(data)
-            elif tag_type == 7:  # Byte Array
-                result[name] = read_nbt_byte_array(data)
-            elif tag_type == 8:  # String
-                result[name] = read_nbt_string(data)
-            elif tag_type == 9:  # List
-                result[name] = read_nbt_list(data)
-            elif tag_type == 10:  # Compound
+            if tag_type == 10:  # Compound
                 result[name] = read_nbt_compound(data, depth + 1)
-            elif tag_type == 11:  # Int Array
-                result[name] = read_nbt_int_array(data)
-            elif tag_type == 12:  # Long Array
-                result[name] = read_nbt_long_array(data)
+            else:
+                reader = _TAG_READERS.get(tag_type)
+                if reader is None:
+                    break
+                result[name] = reader(data)
         except:
             break
     
     return result
 
 
+# Tag type -> payload reader, looked up once per tag instead of walking an if/elif chain
+_TAG_READERS = {
+    1: read_nbt_byte,
+    2: read_nbt_short,
+    3: read_nbt_int,
+    4: read_nbt_long,
+    5: read_nbt_float,
+    6: read_nbt_double,
+    7: read_nbt_byte_array,
+    8: read_nbt_string,
+    9: read_nbt_list,
+    10: read_nbt_compound,
+    11: read_nbt_int_array,
+    12: read_nbt_long_array,
+}
+
+
+# Payload sizes of the fixed-width tag types
+_FIXED_TAG_SIZES = {1: 1, 2: 2, 3: 4, 4: 8, 5: 4, 6: 8}
+
+
+def _read_array_length(data: BytesIO) -> int:
+    """Read an array tag's length, rejecting negative ones that would seek backwards."""
+    length = read_nbt_int(data)
+    if length < 0:
+        raise ValueError(f"Negative array length {length}")
+    return length
+
+
+def skip_nbt_payload(data: BytesIO, tag_type: int) -> None:
+    """Advance past a tag payload without building any Python objects."""
+    size = _FIXED_TAG_SIZES.get(tag_type)
+    if size is not None:
+        data.seek(size, 1)
+    elif tag_type == 7:  # Byte Array
+        data.seek(_read_array_length(data), 1)
+    elif tag_type == 8:  # String
+        data.seek(_U_USHORT(data.read(2))[0], 1)
+    elif tag_type == 9:  # List
+        item_type = read_nbt_byte(data)
+        length = read_nbt_int(data)
+        size = _FIXED_TAG_SIZES.get(item_type)
+        if size is not None:
+            data.seek(max(length, 0) * size, 1)
+        else:
+            for _ in range(length):
+                skip_nbt_payload(data, item_type)
+    elif tag_type == 10:  # Compound
+        while True:
+            child_type = read_nbt_byte(data)
+            if child_type == 0:
+                break
+            data.seek(_U_USHORT(data.read(2))[0], 1)
+            skip_nbt_payload(data, child_type)
+    elif tag_type == 11:  # Int Array
+        data.seek(_read_array_length(data) * 4, 1)
+    elif tag_type == 12:  # Long Array
+        data.seek(_read_array_length(data) * 8, 1)
+    else:
+        raise ValueError(f"Unknown tag type {tag_type}")
+
+
+def read_nbt_compound_filtered(data: BytesIO, wanted: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Read only the named children of a compound, skipping everything else.
+    
+    ``wanted`` maps child names to a nested filter for compound children,
+    or to None to read that child in full.
+    """
+    result = {}
+    
+    while True:
+        try:
+            tag_type = read_nbt_byte(data)
+            
+            if tag_type == 0:  # End tag
+                break
+            
+            name = read_nbt_string(data)
+            
+            if name not in wanted:
+                skip_nbt_payload(data, tag_type)
+            elif tag_type == 10 and wanted[name] is not None:
+                result[name] = read_nbt_compound_filtered(data, wanted[name])
+            elif tag_type == 10:
+                result[name] = read_nbt_compound(data, 1)
+            else:
+                reader = _TAG_READERS.get(tag_type)
+                if reader is None:
+                    break
+                result[name] = reader(data)
+        except:
+            break
+    
+    return result
+
+
+# The only parts of level.dat that get_world_version looks at
+_VERSION_FIELDS = {"Version": None, "version": None, "DataVersion": None}
+_WORLD_VERSION_FIELDS = {"Data": _VERSION_FIELDS, **_VERSION_FIELDS}
+
+
 def decompress_nbt(data: bytes) -> BytesIO:
     """Decompress NBT data if compressed."""
-    # Try gzip first
-    try:
-        import gzip
-        return BytesIO(gzip.decompress(data))
-    except:
-        pass
-    
-    # Try zlib
-    try:
-        import zlib
-        return BytesIO(zlib.decompress(data))
-    except:
-        pass
+    # Sniff the header instead of attempting each codec in turn;
+    # uncompressed NBT always starts with a compound tag (0x0a)
+    if data[:2] == b"\x1f\x8b":
+        try:
+            return BytesIO(gzip.decompress(data))
+        except (OSError, EOFError, zlib.error):
+            pass
+    elif data[:1] == b"\x78":
+        try:
+            return BytesIO(zlib.decompress(data))
+        except zlib.error:
+            pass
     
     # Assume uncompressed
     return BytesIO(data)
 
 
-def parse_nbt(data: bytes) -> Dict[str, Any]:
-    """Parse NBT data and return the root compound."""
+def parse_nbt(data: bytes, wanted: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Parse NBT data and return the root compound, optionally limited to the ``wanted`` paths."""
     stream = decompress_nbt(data)
     
     # Read root tag
@@ -172,7 +266,10 @@ def parse_nbt(data: bytes) -> Dict[str, Any]:
         raise ValueError(f"Expected compound tag at root, got {root_type}")
     
     root_name = read_nbt_string(stream)
-    root_data = read_nbt_compound(stream)
+    if wanted is None:
+        root_data = read_nbt_compound(stream)
+    else:
+        root_data = read_nbt_compound_filtered(stream, wanted)
     
     return {
         "name": root_name,
@@ -188,7 +285,7 @@ def get_world_version(level_dat_path: Union[str, Path]) -> Dict[str, Any]:
         with open(level_dat_path, 'rb') as f:
             data = f.read()
         
-        nbt = parse_nbt(data)
+        nbt = parse_nbt(data, _WORLD_VERSION_FIELDS)
         
         # Navigate to Data -> Version or Data -> DataVersion
         root_data = nbt.get("data", {})
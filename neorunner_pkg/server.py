@@ -17,7 +17,7 @@ from .constants import CWD, MAX_RESTART_ATTEMPTS, MAX_TOTAL_RESTARTS, CRASH_COOL
 from .config import ServerConfig, load_cfg
 from .log import log_event
 from .loaders import get_loader
-from .self_heal import preflight_dep_check, quarantine_mod, load_crash_history, save_crash_history
+from .self_heal import _fetch_dependency, preflight_dep_check, quarantine_mod, load_crash_history, save_crash_history
 
 log = logging.getLogger(__name__)
 
@@ -366,20 +366,32 @@ class TmuxServer:
                 quarantine_mod(mods_dir, culprit, "Client-only mod causes server crash")
                 return
             
-            if dep_name:
-                log_event("SELF_HEAL", f"Missing dependency: {dep_name}" + (f" (required by {culprit})" if culprit else ""))
+            # Loaders that collect every missing dependency report them all in "deps",
+            # so they can be fetched together instead of one restart per dependency
+            deps = crash_info.get("deps") or ([dep_name] if dep_name else [])
+            if deps:
+                log_event("SELF_HEAL", f"Missing dependencies: {', '.join(deps)}" + (f" (required by {culprit})" if culprit else ""))
                 
-                dep_key = dep_name
-                crash_history[dep_key] = crash_history.get(dep_key, 0) + 1
+                to_fetch = []
+                unresolved = None
+                for dep in deps:
+                    crash_history[dep] = crash_history.get(dep, 0) + 1
+                    if crash_history[dep] > 2:
+                        unresolved = unresolved or dep
+                    else:
+                        to_fetch.append(dep)
                 save_crash_history(crash_history)
                 
-                if crash_history[dep_key] > 2:
-                    # If dep can't be resolved, check if culprit is a bad mod
-                    if culprit:
-                        log_event("SELF_HEAL", f"Dep {dep_name} not resolved after {crash_history[dep_key]} attempts. Quarantining {culprit}")
-                        quarantine_mod(mods_dir, culprit, f"Missing dep {dep_name} after {crash_history[dep_key]} attempts")
-                else:
-                    log_event("SELF_HEAL", f"Attempting to fetch missing dep: {dep_name}")
+                if unresolved and culprit:
+                    # If a dep can't be resolved, check if culprit is a bad mod
+                    log_event("SELF_HEAL", f"Dep {unresolved} not resolved after {crash_history[unresolved]} attempts. Quarantining {culprit}")
+                    quarantine_mod(mods_dir, culprit, f"Missing dep {unresolved} after {crash_history[unresolved]} attempts")
+                
+                if to_fetch:
+                    log_event("SELF_HEAL", f"Attempting to fetch missing deps: {', '.join(to_fetch)}")
+                    for dep in to_fetch:
+                        _fetch_dependency(dep, self.cfg.mc_version, self.cfg.loader, mods_dir,
+                                          dependents=[culprit] if culprit else None)
         
         elif crash_type == "mod_error":
             subtype = crash_info.get("subtype", "")
@@ -39,6 +39,8 @@ setup(
     extras_require={
         "full": ["playwright>=1.30.0", "playwright-stealth>=1.0.0"],
         "scraper": ["playwright>=1.30.0", "playwright-stealth>=1.0.0"],
+        "speedups": ["orjson>=3.6.0", "ijson>=3.1.0"],
+        "progress": ["tqdm>=4.0.0"],
     },
     entry_points={
         "console_scripts": [
@@ -135,6 +135,25 @@ class TestNeoForgeLoader:
         assert (TEST_DIR / "user_jvm_args.txt").exists(), "JVM args not created"
         assert (TEST_DIR / "eula.txt").exists(), "eula not created"
         assert (TEST_DIR / "server.properties").exists(), "server.properties not created"
+    
+    def test_crash_reason_cache(self):
+        """Test repeated crash logs are served from the cache as independent copies."""
+        from neorunner_pkg.loaders import _crash_cache, clear_crash_cache
+        from neorunner_pkg.loaders.neoforge import NeoForgeLoader
+        from neorunner_pkg.config import ServerConfig
+        
+        clear_crash_cache()
+        loader = NeoForgeLoader(ServerConfig(), str(TEST_DIR))
+        crash_log = "[Server thread/INFO]: tick\n" * 100 + "Mod create requires flywheel\n"
+        
+        first = loader.detect_crash_reason(crash_log)
+        first["culprits"].append("tampered")
+        second = loader.detect_crash_reason(crash_log)
+        
+        assert len(_crash_cache) == 1
+        assert second["type"] == "missing_dep"
+        assert second["culprits"] == ["create"]
+        clear_crash_cache()
 
 
 class TestForgeLoader:
@@ -164,6 +183,32 @@ class TestForgeLoader:
         assert f"-Xmx{xmx}" in content
         assert f"-Xms{xms}" in content
         assert "echo" not in content
+    
+    def test_jvm_args_regenerated_after_edit(self):
+        """Test JVM args are skipped when unchanged but rewritten after an outside edit."""
+        from neorunner_pkg.loaders.forge import ForgeLoader
+        from neorunner_pkg.config import ServerConfig
+        
+        cfg = ServerConfig()
+        cfg.xmx = "4G"
+        cfg.xms = "2G"
+        cfg.loader = "forge"
+        
+        loader = ForgeLoader(cfg, str(TEST_DIR))
+        loader._setup_jvm_args()
+        jvm_file = TEST_DIR / "user_jvm_args.txt"
+        mtime = jvm_file.stat().st_mtime_ns
+        
+        loader._setup_jvm_args()
+        assert jvm_file.stat().st_mtime_ns == mtime
+        
+        jvm_file.write_text("echo corrupted\n")
+        loader._setup_jvm_args()
+        assert "-Xmx4G" in jvm_file.read_text()
+        
+        cfg.xmx = "8G"
+        loader._setup_jvm_args()
+        assert "-Xmx8G" in jvm_file.read_text()
 
 
 class TestFabricLoader:
@@ -188,6 +233,40 @@ class TestFabricLoader:
         assert "-Xmx4G" in content
         assert "-Xms2G" in content
         assert "echo" not in content
+    
+    @pytest.mark.parametrize("log_text,dep", [
+        ("Mod 'Foo' REQUIRES any version of Fabric-API, which is missing!", "fabric-api"),
+        ("Unmet dependency: cloth-config", "cloth-config"),
+        ("Missing mod: architectury", "architectury"),
+        ("Mod resolution failed for Sodium", "sodium"),
+    ])
+    def test_detect_missing_dep(self, log_text, dep):
+        """Test crash detection recognises each missing-dependency phrasing."""
+        from neorunner_pkg.loaders.fabric import FabricLoader
+        from neorunner_pkg.config import ServerConfig
+        
+        loader = FabricLoader(ServerConfig(), str(TEST_DIR))
+        result = loader.detect_crash_reason(log_text)
+        
+        assert result["type"] == "missing_dep"
+        assert result["dep"] == dep
+    
+    def test_detect_all_missing_deps(self):
+        """Test crash detection reports every missing dependency in one pass."""
+        from neorunner_pkg.loaders.fabric import FabricLoader
+        from neorunner_pkg.config import ServerConfig
+        
+        log = (
+            "Mod 'Foo' requires any version of fabric-api, which is missing!\n"
+            "Unmet dependency: cloth-config\n"
+            "Mod 'Bar' requires fabric-api\n"
+        )
+        loader = FabricLoader(ServerConfig(), str(TEST_DIR))
+        result = loader.detect_crash_reason(log)
+        
+        assert result["type"] == "missing_dep"
+        assert result["deps"] == ["fabric-api", "cloth-config"]
+        assert result["dep"] == "fabric-api"
 
 
 class TestLoaderFactory:
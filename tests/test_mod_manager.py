@@ -0,0 +1,35 @@
+"""Tests for Modrinth/CurseForge mod management."""
+
+import pytest
+import sys
+import os
+import tempfile
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from neorunner_pkg.mod_manager import ModManager, ModInfo
+
+
+class TestModManager:
+    """Test provider merging and installation."""
+    
+    def test_mod_from_both_sources_installed_once(self):
+        """A mod listed by Modrinth and CurseForge is only handed to ferium once."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mm = ModManager({"loader": "neoforge", "mc_version": "1.21.4"}, cwd=tmpdir)
+            modrinth = [
+                ModInfo("jei", "Just Enough Items", "neoforge", "1.21.4", source="modrinth"),
+                ModInfo("sodium", "Sodium", "neoforge", "1.21.4", source="modrinth"),
+            ]
+            curseforge = [
+                ModInfo("jei-curse", "Just-Enough items", "neoforge", "1.21.4", source="curseforge"),
+                ModInfo("create", "Create", "neoforge", "1.21.4", source="curseforge"),
+            ]
+            
+            with patch.object(mm, "get_100_mods_modrinth", return_value=modrinth), \
+                    patch.object(mm, "get_100_mods_curseforge", return_value=curseforge), \
+                    patch.object(mm, "install_mods", return_value={"status": "success"}) as install:
+                mm.install_popular_mods(resolve_deps=False)
+            
+            assert install.call_args[0][0] == ["jei", "sodium", "create"]
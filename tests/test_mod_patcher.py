@@ -0,0 +1,95 @@
+"""Tests for the mixin compatibility patcher."""
+
+import pytest
+import sys
+import os
+import tempfile
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from neorunner_pkg.mod_patcher import ModPatcher
+
+
+def _write_corrupt_jar(path: Path):
+    """Write a JAR whose mixin config is patchable but whose other entry has a broken deflate stream."""
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as zf:
+        zf.writestr("test.mixins.json", '{"package": "com.example.mixin", "mixins": []}')
+        zf.writestr("com/example/Data.class", os.urandom(4096))
+    data = bytearray(path.read_bytes())
+    with zipfile.ZipFile(path) as zf:
+        info = zf.getinfo("com/example/Data.class")
+    # Skip the 30-byte local header, name and extra field to reach the compressed data
+    start = info.header_offset + 30 + len(info.filename) + len(info.extra)
+    data[start:start + 64] = b"\xff" * 64
+    path.write_bytes(bytes(data))
+
+
+class TestModPatcher:
+    """Test JAR patching."""
+    
+    def test_auto_patch_corrupt_jar(self):
+        """A JAR that fails mid-rewrite is left as it was, with no temp output behind."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mods_dir = Path(tmpdir)
+            jar = mods_dir / "a.jar"
+            _write_corrupt_jar(jar)
+            original = jar.read_bytes()
+            
+            patcher = ModPatcher(str(mods_dir), "1.21.4")
+            result = patcher.auto_patch_mod("a.jar")
+            
+            assert result["success"] is True
+            assert result["patched"] is False
+            assert not (mods_dir / "a.jar.tmp").exists()
+            assert jar.read_bytes() == original
+            
+            results = patcher.auto_patch_all()
+            assert results["errors"] == 0
+            assert not (mods_dir / "a.jar.tmp").exists()
+    
+    def test_add_mixin_priority_corrupt_jar(self):
+        """The single-patch helpers report failure on a corrupt JAR and remove their output."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mods_dir = Path(tmpdir)
+            jar = mods_dir / "corrupt.jar"
+            _write_corrupt_jar(jar)
+            out = mods_dir / "out.jar"
+            
+            patcher = ModPatcher(str(mods_dir), "1.21.4")
+            
+            assert patcher.add_mixin_priority(str(jar), str(out), 5) is False
+            assert not out.exists()
+    
+    def test_config_cache_prunes_removed_jars(self):
+        """Cached mixin configs for JARs no longer in the mods folder are dropped on flush."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mods_dir = Path(tmpdir)
+            for name in ("old.jar", "new.jar"):
+                with zipfile.ZipFile(mods_dir / name, 'w') as zf:
+                    zf.writestr("test.mixins.json", '{"package": "com.example.mixin"}')
+            
+            patcher = ModPatcher(str(mods_dir), "1.21.4")
+            patcher.detect_conflict_risk("old.jar")
+            patcher.detect_conflict_risk("new.jar")
+            (mods_dir / "old.jar").unlink()
+            
+            patcher.auto_patch_all()
+            
+            cache = ModPatcher(str(mods_dir), "1.21.4")._config_cache
+            assert list(cache.entries) == [str(mods_dir / "new.jar")]
+            assert not list(mods_dir.glob(".tmp_*"))
+    
+    def test_auto_patch_mod_records_patch(self):
+        """A direct auto_patch_mod call records the patch on disk so the next run skips the JAR."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            mods_dir = Path(tmpdir)
+            with zipfile.ZipFile(mods_dir / "a.jar", 'w') as zf:
+                zf.writestr("test.mixins.json", '{"package": "com.example.mixin"}')
+            
+            assert ModPatcher(str(mods_dir), "1.21.4").auto_patch_mod("a.jar")["patched"] is True
+            
+            results = ModPatcher(str(mods_dir), "1.21.4").auto_patch_all()
+            assert results["patched"] == 0
+            assert results["skipped"] == 1
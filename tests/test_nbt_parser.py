@@ -0,0 +1,37 @@
+"""Tests for the NBT parser."""
+
+import pytest
+import sys
+import os
+import gzip
+import struct
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from neorunner_pkg.nbt_parser import get_world_version
+
+
+def _name(name: str) -> bytes:
+    """Encode an NBT tag name."""
+    raw = name.encode('utf-8')
+    return struct.pack(">H", len(raw)) + raw
+
+
+class TestNbtParser:
+    """Test level.dat parsing."""
+    
+    def test_negative_array_length_in_skipped_compound(self):
+        """A negative array length in a skipped compound falls back instead of looping forever."""
+        # 1 + 3 + 4 header bytes: seeking back -2 * 4 lands on the same tag again
+        other = b"\x0a" + _name("Other") + b"\x0b" + _name("x") + struct.pack(">i", -2) + b"\x00"
+        level_dat = gzip.compress(b"\x0a" + _name("") + other + b"\x00")
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            path = Path(tmpdir) / "level.dat"
+            path.write_bytes(level_dat)
+            
+            result = get_world_version(path)
+        
+        assert result["version"] == "unknown"